@@ -5,15 +5,17 @@ examining specific items in the cache.
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 # Add the src directory to the Python path
 src_path = Path(__file__).parent.parent
 sys.path.insert(0, str(src_path))
 
-# pylint: disable=wrong-import-position
-from oyez_scraping.infrastructure.storage.cache import RawDataCache  # noqa: E402
+if TYPE_CHECKING:
+    from oyez_scraping.infrastructure.storage.cache import RawDataCache
 
 
 def parse_args() -> argparse.Namespace:
@@ -52,6 +54,15 @@ def parse_args() -> argparse.Namespace:
         help="Show the cache directory structure",
     )
 
+    parser.add_argument(
+        "--include-dirs",
+        type=str,
+        help=(
+            "Comma-separated top-level directories to expand with "
+            "--list-structure (e.g., 'cases,audio'; default: all)"
+        ),
+    )
+
     parser.add_argument(
         "--examine-case",
         type=str,
@@ -73,142 +84,233 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def list_cases(cache: RawDataCache) -> None:
+def list_cases(cache: "RawDataCache") -> None:
     """List all cases in the cache.
 
     Args:
         cache: The RawDataCache instance
     """
-    case_ids = cache.get_all_cached_case_ids()
-    if not case_ids:
+    # Collect the audio flag in the same pass over the index
+    cases = [
+        (case_id, case_info.get("has_audio", False))
+        for case_id, case_info in cache.cache_index["cases"].items()
+    ]
+    if not cases:
         print("No cases in cache.")
         return
 
-    print(f"\nCached Cases ({len(case_ids)}):")
-    print("=" * 40)
+    lines = [f"\nCached Cases ({len(cases)}):", "=" * 40]
 
     # Sort cases by term and docket
-    sorted_cases = sorted(case_ids)
+    cases.sort()
 
-    for case_id in sorted_cases:
-        has_audio = cache.cache_index["cases"][case_id].get("has_audio", False)
-        print(f"  {case_id}" + (" [has audio]" if has_audio else ""))
+    for case_id, has_audio in cases:
+        lines.append(f"  {case_id}" + (" [has audio]" if has_audio else ""))
 
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def build_audio_size_index(cache_dir: Path) -> dict[str, int]:
+    """Collect the sizes of all cached audio files in one directory walk.
+
+    Args:
+        cache_dir: The cache directory path
 
-def list_audio(cache: RawDataCache) -> None:
+    Returns
+    -------
+        Dictionary mapping paths relative to the cache directory to file sizes
+    """
+    size_index: dict[str, int] = {}
+    pending = [cache_dir / "audio"]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                    else:
+                        rel_path = os.path.relpath(entry.path, cache_dir)
+                        size_index[rel_path] = entry.stat().st_size
+        except FileNotFoundError:
+            continue
+    return size_index
+
+
+def list_audio(cache: "RawDataCache", size_index: dict[str, int] | None = None) -> None:
     """List all audio files in the cache.
 
     Args:
         cache: The RawDataCache instance
+        size_index: Audio file sizes as returned by build_audio_size_index
+            (built on demand if None)
     """
-    audio_ids = list(cache.cache_index["audio_files"].keys())
-    if not audio_ids:
+    audio_files = cache.cache_index["audio_files"]
+    if not audio_files:
         print("No audio files in cache.")
         return
 
-    print(f"\nCached Audio Files ({len(audio_ids)}):")
-    print("=" * 40)
+    lines = [f"\nCached Audio Files ({len(audio_files)}):", "=" * 40]
 
-    for audio_id in audio_ids:
-        audio_info = cache.cache_index["audio_files"][audio_id]
+    if size_index is None:
+        size_index = build_audio_size_index(cache.cache_dir)
+
+    for audio_id, audio_info in audio_files.items():
         case_id = audio_info.get("case_id", "unknown")
         media_type = audio_info.get("media_type", "unknown")
         path = audio_info.get("path", "unknown")
-        print(f"  ID: {audio_id}")
-        print(f"     Case: {case_id}")
-        print(f"     Type: {media_type}")
-        print(f"     Path: {path}")
+        lines.append(f"  ID: {audio_id}")
+        lines.append(f"     Case: {case_id}")
+        lines.append(f"     Type: {media_type}")
+        lines.append(f"     Path: {path}")
 
         # Get the file size if it exists
-        full_path = cache.cache_dir / path
-        if full_path.exists():
-            size_kb = full_path.stat().st_size / 1024
-            print(f"     Size: {size_kb:.2f} KB")
-        print()
+        size = size_index.get(path)
+        if size is not None:
+            lines.append(f"     Size: {size / 1024:.2f} KB")
+        lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def show_directory_structure(cache_dir: Path, max_depth: int = 3) -> None:
+def show_directory_structure(
+    cache_dir: Path, max_depth: int = 3, include_dirs: set[str] | None = None
+) -> None:
     """Show the cache directory structure.
 
     Args:
         cache_dir: The cache directory path
         max_depth: Maximum depth to display
+        include_dirs: Names of the top-level directories to show (None shows all)
     """
     if not cache_dir.exists():
         print(f"Cache directory {cache_dir} does not exist.")
         return
 
-    print("\nCache Directory Structure:")
-    print("=" * 40)
-
-    def print_dir(path: Path, prefix: str = "", depth: int = 0) -> None:
-        """Print directory structure recursively.
-
-        Args:
-            path: Current path
-            prefix: Prefix for indentation
-            depth: Current depth level
-        """
-        if depth > max_depth:
-            print(f"{prefix}...")
-            return
-
-        # Print current item
-        print(f"{prefix}{path.name}/")
-
-        # Get children sorted by type (directories first, then files)
-        items = sorted(path.iterdir(), key=lambda p: (not p.is_dir(), p.name))
-
-        # Process all items with appropriate prefixes
-        count = len(items)
-        for i, item in enumerate(items):
-            is_last = i == count - 1
-            item_prefix = prefix + ("└── " if is_last else "├── ")
-            next_level_prefix = prefix + ("    " if is_last else "│   ")
-
-            if item.is_dir():
-                # For directories, pass the next level prefix for recursive calls
-                print(f"{item_prefix}{item.name}/")
-                print_dir(item, next_level_prefix, depth + 1)
+    lines = ["\nCache Directory Structure:", "=" * 40]
+
+    # Walk the tree depth-first with an explicit stack. Each item is either a
+    # finished output line or a (path, prefix, depth) directory to expand;
+    # children are pushed in reverse so they pop in display order.
+    stack: list[str | tuple[Path, str, int]] = [(cache_dir, "", 0)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            lines.append(item)
+            continue
+
+        path, prefix, depth = item
+
+        # Add current item
+        lines.append(f"{prefix}{path.name}/")
+
+        # Get children sorted by type (directories first, then files).
+        # DirEntry reuses the file type from the directory listing, avoiding
+        # an extra stat() call per entry. Sorting plain (is_file, name, entry)
+        # tuples needs no key callback; names are unique, so entries are never
+        # compared themselves.
+        with os.scandir(path) as it:
+            entries = [
+                (not entry.is_dir(follow_symlinks=False), entry.name, entry)
+                for entry in it
+            ]
+        entries.sort()
+
+        # Prune top-level directories that weren't asked for before walking them
+        if depth == 0 and include_dirs is not None:
+            entries = [
+                (is_file, name, entry)
+                for is_file, name, entry in entries
+                if is_file or name in include_dirs
+            ]
+
+        # Build the child prefixes once per directory rather than per entry
+        branch_prefixes = (prefix + "├── ", prefix + "└── ")
+        level_prefixes = (prefix + "│   ", prefix + "    ")
+
+        # Build all child items with appropriate prefixes
+        children: list[str | tuple[Path, str, int]] = []
+        last_index = len(entries) - 1
+        for i, (is_file, name, entry) in enumerate(entries):
+            is_last = i == last_index
+            item_prefix = branch_prefixes[is_last]
+            next_level_prefix = level_prefixes[is_last]
+
+            if not is_file:
+                children.append(f"{item_prefix}{name}/")
+                # Directories past the maximum depth are elided without scanning
+                if depth < max_depth:
+                    children.append((Path(entry.path), next_level_prefix, depth + 1))
+                else:
+                    children.append(f"{next_level_prefix}...")
             else:
                 # For files, show their size
-                size_kb = item.stat().st_size / 1024
-                print(f"{item_prefix}{item.name} ({size_kb:.2f} KB)")
+                size = entry.stat().st_size
+                children.append(f"{item_prefix}{name} ({size / 1024:.2f} KB)")
 
-    print_dir(cache_dir)
+        stack.extend(reversed(children))
 
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def examine_case(cache: RawDataCache, case_id: str) -> None:
+
+def group_audio_by_case(
+    cache: "RawDataCache",
+) -> dict[str, list[tuple[str, dict[str, Any]]]]:
+    """Group the cached audio files by the case they belong to.
+
+    Args:
+        cache: The RawDataCache instance
+
+    Returns
+    -------
+        Dictionary mapping case IDs to lists of (audio_id, audio_info) tuples
+    """
+    audio_by_case: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+    for audio_id, audio_info in cache.cache_index["audio_files"].items():
+        audio_by_case.setdefault(audio_info.get("case_id"), []).append(
+            (audio_id, audio_info)
+        )
+    return audio_by_case
+
+
+def examine_case(
+    cache: "RawDataCache",
+    case_id: str,
+    audio_by_case: dict[str, list[tuple[str, dict[str, Any]]]] | None = None,
+    size_index: dict[str, int] | None = None,
+) -> None:
     """Examine the details of a specific case.
 
     Args:
         cache: The RawDataCache instance
         case_id: The ID of the case to examine
+        audio_by_case: Audio files grouped by case, as returned by
+            group_audio_by_case (built on demand if None)
+        size_index: Audio file sizes as returned by build_audio_size_index
+            (built on demand if None)
     """
     if not cache.case_exists(case_id):
         print(f"Case {case_id} not found in cache.")
         return
 
-    print(f"\nCase Details: {case_id}")
-    print("=" * 40)
+    lines = [f"\nCase Details: {case_id}", "=" * 40]
 
     try:
         # Get basic case information from the cache index
         case_index = cache.cache_index["cases"][case_id]
-        print(f"Path: {case_index.get('path', 'unknown')}")
-        print(f"Cached at: {case_index.get('cached_at', 'unknown')}")
-        print(f"Has audio: {case_index.get('has_audio', False)}")
+        lines.append(f"Path: {case_index.get('path', 'unknown')}")
+        lines.append(f"Cached at: {case_index.get('cached_at', 'unknown')}")
+        lines.append(f"Has audio: {case_index.get('has_audio', False)}")
 
         # Load the full case data
         case_data = cache.get_case_data(case_id)
 
         # Print key case information
-        print("\nCase Information:")
-        print(f"  Name: {case_data.get('name', 'unknown')}")
-        print(f"  Term: {case_data.get('term', 'unknown')}")
-        print(f"  Docket: {case_data.get('docket_number', 'unknown')}")
-        print(f"  Argued: {case_data.get('argued_on', 'unknown')}")
-        print(f"  Decided: {case_data.get('decided_on', 'unknown')}")
+        lines.append("\nCase Information:")
+        lines.append(f"  Name: {case_data.get('name', 'unknown')}")
+        lines.append(f"  Term: {case_data.get('term', 'unknown')}")
+        lines.append(f"  Docket: {case_data.get('docket_number', 'unknown')}")
+        lines.append(f"  Argued: {case_data.get('argued_on', 'unknown')}")
+        lines.append(f"  Decided: {case_data.get('decided_on', 'unknown')}")
 
         # Check for audio content
         oral_args = case_data.get("oral_argument_audio", [])
@@ -218,46 +320,48 @@ def examine_case(cache: RawDataCache, case_id: str) -> None:
         audio_count = len(oral_args) + len(opinion_ann)
 
         if audio_count > 0:
-            print("\nAvailable Audio Content:")
+            lines.append("\nAvailable Audio Content:")
 
             if oral_args:
-                print(f"  Oral Arguments: {len(oral_args)}")
+                lines.append(f"  Oral Arguments: {len(oral_args)}")
                 for i, arg in enumerate(oral_args):
-                    print(
+                    lines.append(
                         f"    {i + 1}. {arg.get('title', 'Unknown')} - {arg.get('href', 'No URL')}"
                     )
 
             if opinion_ann:
-                print(f"  Opinion Announcements: {len(opinion_ann)}")
+                lines.append(f"  Opinion Announcements: {len(opinion_ann)}")
                 for i, op in enumerate(opinion_ann):
-                    print(
+                    lines.append(
                         f"    {i + 1}. {op.get('title', 'Unknown')} - {op.get('href', 'No URL')}"
                     )
         else:
-            print("\nNo audio content available for this case.")
+            lines.append("\nNo audio content available for this case.")
 
         # Find related audio files in the cache
-        related_audio = []
-        for audio_id, audio_info in cache.cache_index["audio_files"].items():
-            if audio_info.get("case_id") == case_id:
-                related_audio.append((audio_id, audio_info))
+        if audio_by_case is None:
+            audio_by_case = group_audio_by_case(cache)
+        related_audio = audio_by_case.get(case_id, [])
 
         if related_audio:
-            print("\nCached Audio Files for this Case:")
+            if size_index is None:
+                size_index = build_audio_size_index(cache.cache_dir)
+            lines.append("\nCached Audio Files for this Case:")
             for audio_id, audio_info in related_audio:
-                path = cache.cache_dir / audio_info.get("path", "")
-                size_kb = path.stat().st_size / 1024 if path.exists() else 0
-                print(f"  ID: {audio_id}")
-                print(f"  Type: {audio_info.get('media_type', 'unknown')}")
-                print(f"  Path: {audio_info.get('path', 'unknown')}")
-                print(f"  Size: {size_kb:.2f} KB")
-                print()
+                size = size_index.get(audio_info.get("path", ""), 0)
+                lines.append(f"  ID: {audio_id}")
+                lines.append(f"  Type: {audio_info.get('media_type', 'unknown')}")
+                lines.append(f"  Path: {audio_info.get('path', 'unknown')}")
+                lines.append(f"  Size: {size / 1024:.2f} KB")
+                lines.append("")
 
     except Exception as e:
-        print(f"Error examining case: {e}")
+        lines.append(f"Error examining case: {e}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def examine_audio(cache: RawDataCache, audio_id: str) -> None:
+def examine_audio(cache: "RawDataCache", audio_id: str) -> None:
     """Examine the details of a specific audio file.
 
     Args:
@@ -284,11 +388,14 @@ def examine_audio(cache: RawDataCache, audio_id: str) -> None:
         print(f"Path: {path}")
         print(f"Cached at: {cached_at}")
 
-        # Get file information
+        # Get file information with a single stat() call
         full_path = cache.cache_dir / path
-        if full_path.exists():
-            size_kb = full_path.stat().st_size / 1024
-            print(f"Size: {size_kb:.2f} KB")
+        try:
+            size = full_path.stat().st_size
+        except OSError:
+            size = None
+        if size is not None:
+            print(f"Size: {size / 1024:.2f} KB")
             print(f"Full Path: {full_path}")
 
             # If it's an audio file, attempt to get some basic metadata
@@ -308,17 +415,21 @@ def examine_audio(cache: RawDataCache, audio_id: str) -> None:
         print(f"Error examining audio: {e}")
 
 
-def show_cache_index(cache: RawDataCache) -> None:
+def show_cache_index(
+    cache: "RawDataCache", stats: dict[str, Any] | None = None
+) -> None:
     """Show the cache index contents.
 
     Args:
         cache: The RawDataCache instance
+        stats: Cache statistics from get_cache_stats (fetched if None)
     """
     print("\nCache Index Contents:")
     print("=" * 40)
 
     # Get statistics
-    stats = cache.get_cache_stats()
+    if stats is None:
+        stats = cache.get_cache_stats()
     print(f"Case count: {stats['case_count']}")
     print(f"Audio count: {stats['audio_count']}")
     print(f"Case list count: {stats['case_list_count']}")
@@ -339,43 +450,55 @@ def main() -> None:
     """
     args = parse_args()
 
+    # Imported here so that --help doesn't pay for loading the storage stack
+    from oyez_scraping.infrastructure.storage.cache import (  # noqa: PLC0415
+        RawDataCache,
+    )
+
     # Initialize the cache
     cache_dir = Path(args.cache_dir)
     cache = RawDataCache(cache_dir)
+    stats = cache.get_cache_stats()
+
+    # The audio tree is only walked up front when listing every audio file;
+    # examine_case builds the index itself if the case turns out to have audio
+    size_index = build_audio_size_index(cache_dir) if args.list_audio else None
 
     # Process commands
     if args.list_cases:
         list_cases(cache)
 
     if args.list_audio:
-        list_audio(cache)
+        list_audio(cache, size_index)
 
     if args.list_structure:
-        show_directory_structure(cache_dir)
+        include_dirs = (
+            {name.strip() for name in args.include_dirs.split(",") if name.strip()}
+            if args.include_dirs
+            else None
+        )
+        show_directory_structure(cache_dir, include_dirs=include_dirs)
 
     if args.examine_case:
-        examine_case(cache, args.examine_case)
+        examine_case(cache, args.examine_case, group_audio_by_case(cache), size_index)
 
     if args.examine_audio:
         examine_audio(cache, args.examine_audio)
 
     if args.show_index:
-        show_cache_index(cache)
+        show_cache_index(cache, stats)
 
     # If no commands were specified, show usage
-    if not any(
-        [
-            args.list_cases,
-            args.list_audio,
-            args.list_structure,
-            args.examine_case,
-            args.examine_audio,
-            args.show_index,
-        ]
+    if not (
+        args.list_cases
+        or args.list_audio
+        or args.list_structure
+        or args.examine_case
+        or args.examine_audio
+        or args.show_index
     ):
         print("No actions specified. Use --help to see available options.")
         # Show basic cache stats
-        stats = cache.get_cache_stats()
         print("\nCache Summary:")
         print(f"  Location: {cache_dir.resolve()}")
         print(f"  Cases: {stats['case_count']}")
@@ -5,10 +5,12 @@ This script uses the request tracking system to investigate why only 30 cases
 are being returned from the Oyez API when there should be more.
 """
 
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Any
 
+from oyez_scraping.infrastructure import json_codec
 from oyez_scraping.infrastructure.api.rate_limiter import AdaptiveRateLimiter
 from oyez_scraping.infrastructure.api.tracked_client import TrackedOyezClient
 from oyez_scraping.infrastructure.monitoring.request_logger import RequestLogger
@@ -68,37 +70,19 @@ def test_different_pagination_values() -> None:
         },
     ]
 
+    # The probes are independent network requests, so overlap them. Workers
+    # are capped to stay polite; the client rate limit still spaces them out.
     results = []
-
-    for i, test_case in enumerate(test_cases):
-        per_page = test_case["per_page"]
-        term = test_case["term"]
-        description = test_case["description"]
-
-        data_filename = f"pagination_test_{i}.json"
-
-        logger.info(f"Running test {i}: {description}")
-        try:
-            cases = client.get_all_cases(
-                term=term,
-                per_page=per_page,
-                data_filename=data_filename,
-            )
-
-            # Record results
-            result = {
-                "test_id": i,
-                "description": description,
-                "per_page": per_page,
-                "term": term,
-                "cases_returned": len(cases),
-            }
-            results.append(result)
-
-            logger.info(f"Test {i} returned {len(cases)} cases")
-
-        except Exception as e:
-            logger.error(f"Test {i} failed with error: {e}")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(_run_pagination_test, i, test_case, client)
+            for i, test_case in enumerate(test_cases)
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            if result is not None:
+                results.append(result)
+    results.sort(key=lambda result: result["test_id"])
 
     # Print summary
     logger.info("\nTest Results Summary:")
@@ -110,8 +94,7 @@ def test_different_pagination_values() -> None:
 
     # Save results to a file
     results_file = REQUEST_LOGS_DIR / "pagination_test_results.json"
-    with open(results_file, "w") as f:
-        json.dump(results, f, indent=2)
+    results_file.write_bytes(json_codec.dumps(results, indent=2))
 
     logger.info(f"Results saved to {results_file}")
 
@@ -119,25 +102,68 @@ def test_different_pagination_values() -> None:
     examine_request_logs(results)
 
 
+def _run_pagination_test(
+    i: int, test_case: dict[str, Any], client: TrackedOyezClient
+) -> dict[str, Any] | None:
+    """Run a single pagination test case.
+
+    Args:
+        i: Index of the test case
+        test_case: The pagination parameters and description
+        client: The tracked client to issue requests with
+
+    Returns
+    -------
+        The test result, or None if the request failed
+    """
+    per_page = test_case["per_page"]
+    term = test_case["term"]
+    description = test_case["description"]
+
+    data_filename = f"pagination_test_{i}.json"
+
+    logger.info(f"Running test {i}: {description}")
+    try:
+        cases = client.get_all_cases(
+            term=term,
+            per_page=per_page,
+            data_filename=data_filename,
+        )
+    except Exception as e:
+        logger.error(f"Test {i} failed with error: {e}")
+        return None
+
+    logger.info(f"Test {i} returned {len(cases)} cases")
+
+    # Record results
+    return {
+        "test_id": i,
+        "description": description,
+        "per_page": per_page,
+        "term": term,
+        "cases_returned": len(cases),
+    }
+
+
 def examine_request_logs(results) -> None:
     """Examine the request logs for the pagination tests."""
     logger.info("\nExamining request logs:")
 
     request_logger = RequestLogger(REQUEST_LOGS_DIR)
+    case_lists_dir = APP_CACHE_DIR / "raw" / "case_lists"
 
     for result in results:
         test_id = result["test_id"]
         data_filename = f"pagination_test_{test_id}.json"
 
         # Construct a mock data file path
-        data_file_path = Path(".app_cache/raw/case_lists") / data_filename
+        data_file_path = case_lists_dir / data_filename
 
         # Find the request log for this file
         log_file = request_logger.find_request_log_for_data_file(data_file_path)
 
         if log_file and log_file.exists():
-            with open(log_file) as f:
-                log_data = json.load(f)
+            log_data = json_codec.loads(log_file.read_bytes())
 
             # Extract pagination info
             pagination_info = log_data.get("pagination_info", {})
@@ -6,11 +6,13 @@ when auto_paginate=True, the maximum page size (1000) is always used
 regardless of any provided per_page value.
 """
 
+import contextlib
 import logging
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import Any
 
 from oyez_scraping.infrastructure.api.case_client import OyezCaseClient
-from oyez_scraping.infrastructure.api.rate_limiter import AdaptiveRateLimiter
 
 # Configure logging
 logging.basicConfig(
@@ -26,23 +28,77 @@ REQUEST_LOGS_DIR = APP_CACHE_DIR / "request_logs"
 REQUEST_LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def test_autopagination() -> None:
-    """Test that auto-pagination always uses MAX_PAGE_SIZE."""
-    logger.info("Testing auto-pagination functionality")
+@contextlib.contextmanager
+def _temporary_level(target: logging.Logger, level: int) -> Iterator[None]:
+    """Temporarily change a logger's level, restoring it even on errors.
+
+    Args:
+        target: The logger to adjust
+        level: The level to use inside the context
+    """
+    old_level = target.level
+    target.setLevel(level)
+    try:
+        yield
+    finally:
+        target.setLevel(old_level)
+
+
+def _run_tests(
+    fetch: Callable[..., list[dict[str, Any]]], test_cases: list[dict[str, Any]]
+) -> None:
+    """Run pagination test cases against a client method and log a summary.
+
+    Args:
+        fetch: Bound client method that returns a list of cases
+        test_cases: Test cases, each with a description and the keyword
+            arguments to pass to fetch
+    """
+    results = []
+    package_logger = logging.getLogger("oyez_scraping")
+
+    for i, test_case in enumerate(test_cases):
+        description = test_case["description"]
+        params = {
+            key: value for key, value in test_case.items() if key != "description"
+        }
+
+        logger.info(f"\nRunning test {i}: {description}")
+        try:
+            # Enable debug logging just for this test
+            with _temporary_level(package_logger, logging.DEBUG):
+                cases = fetch(**params)
+
+            # Record results
+            result = {
+                "test_id": i,
+                "description": description,
+                **params,
+                "cases_returned": len(cases),
+            }
+            results.append(result)
+
+            logger.info(f"Test {i} returned {len(cases)} cases")
+
+        except Exception as e:
+            logger.error(f"Test {i} failed with error: {e}")
+
+    # Print summary
+    logger.info("\nTest Results Summary:")
+    for result in results:
+        logger.info(
+            f"Test {result['test_id']}: {result['description']} -> "
+            f"{result['cases_returned']} cases"
+        )
 
-    # Create a rate limiter with adaptive parameters
-    rate_limiter = AdaptiveRateLimiter(
-        min_delay=0.5,
-        max_delay=5.0,
-        backoff_factor=1.5,
-        jitter=0.25,
-    )
 
-    # Create the client
-    client = OyezCaseClient(
-        timeout=30,
-        rate_limiter=rate_limiter,
-    )
+def test_autopagination(client: OyezCaseClient) -> None:
+    """Test that auto-pagination always uses MAX_PAGE_SIZE.
+
+    Args:
+        client: The case client to run the tests with
+    """
+    logger.info("Testing auto-pagination functionality")
 
     # Get the maximum page size from the client
     max_page_size = client.MAX_PAGE_SIZE
@@ -76,72 +132,18 @@ def test_autopagination() -> None:
         },
     ]
 
-    results = []
-
-    for i, test_case in enumerate(test_cases):
-        per_page = test_case["per_page"]
-        auto_paginate = test_case["auto_paginate"]
-        term = test_case["term"]
-        description = test_case["description"]
-
-        logger.info(f"\nRunning test {i}: {description}")
-        try:
-            # Enable debug logging just for this test
-            logging.getLogger("oyez_scraping").setLevel(logging.DEBUG)
-
-            # Use get_cases_by_term to demonstrate the functionality
-            cases = client.get_cases_by_term(
-                term=term,
-                per_page=per_page,
-                auto_paginate=auto_paginate,
-            )
+    # Use get_cases_by_term to demonstrate the functionality
+    _run_tests(client.get_cases_by_term, test_cases)
 
-            # Reset logging level
-            logging.getLogger("oyez_scraping").setLevel(logging.INFO)
 
-            # Record results
-            result = {
-                "test_id": i,
-                "description": description,
-                "per_page_requested": per_page,
-                "auto_paginate": auto_paginate,
-                "term": term,
-                "cases_returned": len(cases),
-            }
-            results.append(result)
+def test_get_all_cases_autopagination(client: OyezCaseClient) -> None:
+    """Test auto-pagination with get_all_cases method.
 
-            logger.info(f"Test {i} returned {len(cases)} cases")
-
-        except Exception as e:
-            logger.error(f"Test {i} failed with error: {e}")
-
-    # Print summary
-    logger.info("\nTest Results Summary:")
-    for result in results:
-        logger.info(
-            f"Test {result['test_id']}: {result['description']} -> "
-            f"{result['cases_returned']} cases"
-        )
-
-
-def test_get_all_cases_autopagination() -> None:
-    """Test auto-pagination with get_all_cases method."""
+    Args:
+        client: The case client to run the tests with
+    """
     logger.info("\nTesting get_all_cases auto-pagination functionality")
 
-    # Create a rate limiter with adaptive parameters
-    rate_limiter = AdaptiveRateLimiter(
-        min_delay=0.5,
-        max_delay=5.0,
-        backoff_factor=1.5,
-        jitter=0.25,
-    )
-
-    # Create the client
-    client = OyezCaseClient(
-        timeout=30,
-        rate_limiter=rate_limiter,
-    )
-
     # Test cases to demonstrate that auto-pagination always uses MAX_PAGE_SIZE
     test_cases = [
         {
@@ -158,55 +160,13 @@ def test_get_all_cases_autopagination() -> None:
         },
     ]
 
-    results = []
-
-    for i, test_case in enumerate(test_cases):
-        per_page = test_case["per_page"]
-        auto_paginate = test_case["auto_paginate"]
-        labels = test_case["labels"]
-        description = test_case["description"]
-
-        logger.info(f"\nRunning test {i}: {description}")
-        try:
-            # Enable debug logging just for this test
-            logging.getLogger("oyez_scraping").setLevel(logging.DEBUG)
-
-            # Get cases
-            cases = client.get_all_cases(
-                labels=labels,
-                per_page=per_page,
-                auto_paginate=auto_paginate,
-            )
-
-            # Reset logging level
-            logging.getLogger("oyez_scraping").setLevel(logging.INFO)
-
-            # Record results
-            result = {
-                "test_id": i,
-                "description": description,
-                "per_page_requested": per_page,
-                "auto_paginate": auto_paginate,
-                "cases_returned": len(cases),
-            }
-            results.append(result)
-
-            logger.info(f"Test {i} returned {len(cases)} cases")
-
-        except Exception as e:
-            logger.error(f"Test {i} failed with error: {e}")
-
-    # Print summary
-    logger.info("\nTest Results Summary:")
-    for result in results:
-        logger.info(
-            f"Test {result['test_id']}: {result['description']} -> "
-            f"{result['cases_returned']} cases"
-        )
+    _run_tests(client.get_all_cases, test_cases)
 
 
 if __name__ == "__main__":
     logger.info("Starting pagination demonstration")
-    test_autopagination()
-    test_get_all_cases_autopagination()
+    # A single client is shared so both demonstrations use the same session
+    client = OyezCaseClient(timeout=30)
+    test_autopagination(client)
+    test_get_all_cases_autopagination(client)
     logger.info("Demonstration complete")
@@ -6,6 +6,7 @@ raw data from the Oyez API.
 """
 
 import argparse
+import datetime
 import logging
 import sys
 from pathlib import Path
@@ -13,6 +14,7 @@ from pathlib import Path
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from oyez_scraping.infrastructure.storage.filesystem import FilesystemStorage
 from oyez_scraping.services.raw_data_scraper import RawDataScraperService
 
 
@@ -135,7 +137,7 @@ def scrape_specific_case(
     )
 
     # Count audio files
-    audio_count = sum(len(content_list) for content_list in audio_content.values())
+    audio_count = sum(map(len, audio_content.values()))
     print(f"Downloaded {audio_count} audio files")
 
     # Show the audio content types
@@ -170,17 +172,13 @@ def list_recent_terms(num_terms: int) -> None:
     Args:
         num_terms: Number of recent terms to list
     """
-    # Get current year for calculating terms
-    import datetime
-
-    current_year = datetime.datetime.now().year
-
     # Supreme Court terms typically start in October and are numbered by the year they start
     # So the 2019 term starts in October 2019 and runs to June/July 2020
+    latest_term = datetime.date.today().year - 1
+    lines = [f"  {latest_term - i}" for i in range(num_terms)]
     print(f"\nLatest {num_terms} Supreme Court terms:")
-    for i in range(num_terms):
-        term_year = current_year - i - 1
-        print(f"  {term_year}")
+    if lines:
+        print("\n".join(lines))
 
 
 def show_final_cache_info(scraper: RawDataScraperService, cache_dir: str) -> None:
@@ -213,11 +211,7 @@ def get_directory_size(directory: Path) -> float:
     -------
         Size in megabytes
     """
-    total_size = 0
-
-    for path in directory.glob("**/*"):
-        if path.is_file():
-            total_size += path.stat().st_size
+    total_size = FilesystemStorage.get_directory_size(directory)
 
     return total_size / (1024 * 1024)  # Convert bytes to MB
 
@@ -14,16 +14,19 @@ import torchaudio as ta
 
 
 def ta_save_flac(flac_path: str, samples: torch.Tensor, sample_rate: int) -> None:
-    """Save audio samples to a FLAC file with appropriate normalization.
+    """Save float audio samples to a 24-bit FLAC file.
+
+    Samples are handed to torchaudio as floats, which converts them to PCM
+    during encoding. They are only rescaled when they exceed [-1, 1].
 
     Args:
         flac_path: Path where the FLAC file will be saved.
         samples: Audio samples tensor.
         sample_rate: Sampling rate of the audio.
     """
-    samples = samples - samples.min()
-    samples = samples / samples.max()
-    samples = (samples * (2**31 - 2**24)).to(torch.int32)
+    peak = samples.abs().max()
+    if peak > 1:
+        samples = samples / peak
     ta.save(
         str(flac_path),
         samples[None, :],
@@ -35,7 +38,7 @@ def ta_save_flac(flac_path: str, samples: torch.Tensor, sample_rate: int) -> Non
 
 
 def ta_load_flac(flac_path: str) -> tuple[torch.Tensor, int]:
-    """Load audio samples from a FLAC file with appropriate denormalization.
+    """Load audio samples from a FLAC file as floats in [-1, 1].
 
     Args:
         flac_path: Path to the FLAC file to load.
@@ -44,9 +47,7 @@ def ta_load_flac(flac_path: str) -> tuple[torch.Tensor, int]:
     -------
         Tuple containing audio samples tensor and sampling rate.
     """
-    samples, sr = ta.load(flac_path, normalize=False, format="flac")
-    samples = (samples / (2**30 - 2**24)).to(torch.float32)
-    return samples, sr
+    return ta.load(flac_path, format="flac")
 
 
 def load(audio_path: str, sample_rate: int) -> torch.Tensor:
@@ -72,8 +73,8 @@ def load(audio_path: str, sample_rate: int) -> torch.Tensor:
     assert sr == sample_rate
     assert samples.shape[0] == 1
     samples = samples[0, :]
-    samples = samples - samples.mean()
-    samples = samples / samples.std()
+    std, mean = torch.std_mean(samples)
+    samples.sub_(mean).div_(std)
     return samples
 
 
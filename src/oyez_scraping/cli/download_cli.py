@@ -8,12 +8,15 @@ import argparse
 import datetime
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add the parent directory to the Python path if running as script
 if __name__ == "__main__":
     sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
+from oyez_scraping.infrastructure.api.case_client import OyezCaseClient
+from oyez_scraping.infrastructure.api.client import POOL_MAXSIZE
 from oyez_scraping.infrastructure.storage.filesystem import FilesystemStorage
 from oyez_scraping.services.download_service import DownloadService
 from oyez_scraping.services.raw_data_scraper import RawDataScraperService
@@ -117,41 +120,41 @@ def generate_recent_terms(num_terms: int) -> list[str]:
     -------
         List of term years as strings
     """
-    if num_terms <= 0:
-        return []
-
-    current_year = datetime.datetime.now().year
-
     # Supreme Court terms typically start in October and are numbered by the year they start
     # So the 2019 term starts in October 2019 and runs to June/July 2020
-    terms = []
-    for i in range(num_terms):
-        term_year = current_year - i - 1
-        terms.append(str(term_year))
-
-    return terms
+    latest_term = datetime.date.today().year - 1
+    return [str(latest_term - i) for i in range(num_terms)]
 
 
 def handle_dry_run(
-    scraper: RawDataScraperService, terms: list[str] | None = None
+    scraper: RawDataScraperService,
+    terms: list[str] | None = None,
+    max_workers: int = 4,
 ) -> None:
     """Process a dry run, showing what would be downloaded without actually downloading.
 
     Args:
         scraper: The RawDataScraperService instance
         terms: Optional list of term years to download
+        max_workers: Maximum number of term case lists fetched concurrently
     """
     logger = logging.getLogger(__name__)
 
     logger.info("Dry run mode - would download the following:")
     if terms:
         logger.info(f"Terms: {', '.join(terms)}")
-        for term in terms:
-            try:
-                case_list = scraper.scrape_term(term)
-                logger.info(f"  - Term {term}: {len(case_list)} cases")
-            except Exception as e:
-                logger.error(f"Error fetching case list for term {term}: {e}")
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                term: executor.submit(scraper.scrape_term, term) for term in terms
+            }
+
+            # Report in the requested term order while fetches run concurrently
+            for term, future in futures.items():
+                try:
+                    case_list = future.result()
+                    logger.info(f"  - Term {term}: {len(case_list)} cases")
+                except Exception as e:
+                    logger.error(f"Error fetching case list for term {term}: {e}")
     else:
         logger.info("All available cases")
         try:
@@ -168,10 +171,14 @@ def main() -> None:
 
     logger = logging.getLogger(__name__)
 
-    # Create base components
-    cache_dir = Path(args.cache_dir)
+    # Create base components, resolving the cache directory once so every
+    # component works with the same absolute path
+    cache_dir = Path(args.cache_dir).resolve()
     filesystem_storage = FilesystemStorage()
-    scraper = RawDataScraperService(cache_dir=cache_dir)
+    # All worker threads share the client's session, so keep at least one
+    # pooled connection per worker
+    api_client = OyezCaseClient(pool_maxsize=max(args.workers, POOL_MAXSIZE))
+    scraper = RawDataScraperService(cache_dir=cache_dir, api_client=api_client)
 
     # Process recent terms if specified
     terms = args.terms
@@ -187,7 +194,7 @@ def main() -> None:
 
     # Handle dry run mode
     if args.dry_run:
-        handle_dry_run(scraper, terms)
+        handle_dry_run(scraper, terms, max_workers=args.workers)
         return
 
     # Create the download service
@@ -202,7 +209,7 @@ def main() -> None:
 
     # Show info about what we're about to do
     logger.info("Starting Oyez dataset download")
-    logger.info(f"Cache directory: {cache_dir.resolve()}")
+    logger.info(f"Cache directory: {cache_dir}")
     logger.info(f"Workers: {args.workers}")
 
     if args.skip_audio:
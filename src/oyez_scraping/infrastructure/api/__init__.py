@@ -9,6 +9,7 @@ from oyez_scraping.infrastructure.api.case_client import (
     AudioContentType,
     OyezCaseClient,
 )
+from oyez_scraping.infrastructure.api.circuit_breaker import CircuitBreaker
 from oyez_scraping.infrastructure.api.client import OyezClient
 from oyez_scraping.infrastructure.api.pagination_mixin import PaginationMixin
 from oyez_scraping.infrastructure.api.rate_limiter import AdaptiveRateLimiter
@@ -17,6 +18,7 @@ from oyez_scraping.infrastructure.api.tracked_client import TrackedOyezClient
 __all__ = [
     "AdaptiveRateLimiter",
     "AudioContentType",
+    "CircuitBreaker",
     "OyezCaseClient",
     "OyezClient",
     "PaginationMixin",
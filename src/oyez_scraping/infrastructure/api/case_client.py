@@ -469,6 +469,9 @@ class OyezCaseClient(OyezClient, PaginationMixin):
     def extract_audio_url(self, audio_content_data: dict[str, Any]) -> str:
         """Extract the best audio URL from audio content data.
 
+        MP3 files are preferred; other audio and streaming formats are only
+        used when no MP3 is available.
+
         Args:
             audio_content_data: The audio content data from the API
 
@@ -492,8 +495,9 @@ class OyezCaseClient(OyezClient, PaginationMixin):
                 "No media files found for the audio content"
             )
 
-        # Look for audio URLs
-        audio_url = None
+        # Look for an MP3 URL, remembering the first other audio URL as a
+        # fallback in case the media files contain no MP3
+        fallback = None
         audio_formats = []
 
         for media in media_files:
@@ -510,25 +514,30 @@ class OyezCaseClient(OyezClient, PaginationMixin):
             # Track all found formats for debugging
             audio_formats.append(f"{mime} ({href})")
 
+            mime_lower = mime.lower()
+            href_lower = href.lower()
+            if mime_lower == "audio/mpeg" or href_lower.endswith(".mp3"):
+                logger.debug(f"Found audio URL: {href} ({mime})")
+                return href
+
             # Accept various audio formats and streaming formats
-            if (
-                "audio" in mime.lower()
-                or ".mp3" in href.lower()
-                or ".m3u8" in href.lower()  # HLS streaming format
-                or ".mpd" in href.lower()  # DASH streaming format
+            if fallback is None and (
+                "audio" in mime_lower
+                or ".mp3" in href_lower
+                or ".m3u8" in href_lower  # HLS streaming format
+                or ".mpd" in href_lower  # DASH streaming format
             ):
-                audio_url = href
-                if audio_url:
-                    logger.debug(f"Found audio URL: {audio_url} ({mime})")
-                    break
+                fallback = (href, mime)
 
-        if not audio_url:
+        if fallback is None:
             found_formats = ", ".join(audio_formats) if audio_formats else "none"
             logger.warning(
                 f"No audio URL found in media files. Found formats: {found_formats}"
             )
             raise OyezResourceNotFoundError("No audio URL found in media files")
 
+        audio_url, mime = fallback
+        logger.debug(f"Found audio URL: {audio_url} ({mime})")
         return audio_url
 
     def extract_speakers(
@@ -834,6 +843,13 @@ class OyezCaseClient(OyezClient, PaginationMixin):
             speaker_id: The ID of the speaker
             utterances: List to append valid utterances to
         """
+        # Segments without a speaker can never produce an utterance
+        if not speaker_id:
+            return
+
+        # Bind the append method once for the per-segment loop
+        append = utterances.append
+
         for segment in segments:
             if not isinstance(segment, dict):
                 continue
@@ -842,13 +858,8 @@ class OyezCaseClient(OyezClient, PaginationMixin):
             segment_end_time = segment.get("stop", None)  # API uses "stop" not "end"
             text = segment.get("text", "")
 
-            if (
-                speaker_id
-                and segment_start_time is not None
-                and segment_end_time is not None
-                and text
-            ):
-                utterances.append(
+            if segment_start_time is not None and segment_end_time is not None and text:
+                append(
                     {
                         "speaker_id": speaker_id,
                         "start_time": segment_start_time,
@@ -874,18 +885,12 @@ class OyezCaseClient(OyezClient, PaginationMixin):
             end_time: End time of the turn
             utterances: List to append valid utterances to
         """
-        combined_text = ""
-
         # Combine all text blocks into a single utterance
-        for block in text_blocks:
-            if not isinstance(block, dict):
-                continue
-
-            block_text = block.get("text", "")
-            if block_text:
-                if combined_text:
-                    combined_text += " "
-                combined_text += block_text
+        combined_text = " ".join(
+            block_text
+            for block in text_blocks
+            if isinstance(block, dict) and (block_text := block.get("text", ""))
+        )
 
         if (
             speaker_id
@@ -921,9 +926,9 @@ class OyezCaseClient(OyezClient, PaginationMixin):
             if not isinstance(speaker, dict):
                 continue
 
-            speaker_id = segment.get("speaker", {}).get("identifier", "")
-            if not speaker_id and "name" in segment.get("speaker", {}):
-                speaker_id = segment.get("speaker", {}).get("name", "")
+            speaker_id = speaker.get("identifier", "")
+            if not speaker_id and "name" in speaker:
+                speaker_id = speaker.get("name", "")
 
             text = segment.get("text", "")
 
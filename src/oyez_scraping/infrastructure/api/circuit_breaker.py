@@ -0,0 +1,76 @@
+"""Circuit breaker for failing fast while the Oyez API is unavailable.
+
+This module provides a circuit breaker that stops sending requests after
+repeated connection failures, so callers fail immediately during an outage
+instead of each waiting out their own timeouts and retries.
+"""
+
+import logging
+import threading
+import time
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Stop requests after repeated failures and probe again after a cooldown.
+
+    The circuit opens after failure_threshold consecutive failures. While it is
+    open, requests are rejected without being sent. Once reset_timeout seconds
+    have passed requests are let through again as probes: a success closes the
+    circuit, a failure keeps it open for another cooldown. A single instance can
+    be shared between threads.
+    """
+
+    def __init__(
+        self, failure_threshold: int = 10, reset_timeout: float = 30.0
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures after which the circuit opens
+            reset_timeout: Seconds to wait before probing an open circuit
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self.opened_at: float | None = None
+        # Protects the circuit state when the breaker is shared between threads
+        self.lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent.
+
+        Returns
+        -------
+            True if the circuit is closed or its cooldown has passed, False if
+            the request should be skipped
+        """
+        with self.lock:
+            return (
+                self.opened_at is None
+                or time.monotonic() - self.opened_at >= self.reset_timeout
+            )
+
+    def record_success(self) -> None:
+        """Close the circuit after a request reached the server."""
+        with self.lock:
+            if self.opened_at is not None:
+                logger.info("Oyez API is reachable again, closing circuit")
+            self.consecutive_failures = 0
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit when it keeps failing."""
+        with self.lock:
+            self.consecutive_failures += 1
+            if self.opened_at is not None:
+                # The probe failed, wait another cooldown
+                self.opened_at = time.monotonic()
+            elif self.consecutive_failures >= self.failure_threshold:
+                logger.warning(
+                    f"Opening circuit after {self.consecutive_failures} consecutive "
+                    f"failures; skipping requests for {self.reset_timeout:.0f}s"
+                )
+                self.opened_at = time.monotonic()
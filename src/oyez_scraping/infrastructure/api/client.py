@@ -5,22 +5,56 @@ interacting with the Oyez API, including rate limiting and retry logic.
 """
 
 import logging
+import time
 from typing import Any
 
 import backoff
 import requests
 from ratelimit import RateLimitException, limits
+from requests.adapters import HTTPAdapter
 
+from .. import json_codec
 from ..exceptions.api_exceptions import (
+    CircuitOpenError,
     OyezApiConnectionError,
     OyezApiError,
     OyezApiResponseError,
     OyezResourceNotFoundError,
+    RateLimitError,
 )
+from .circuit_breaker import CircuitBreaker
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Status codes signalling that the server is throttling or temporarily overloaded
+THROTTLE_STATUS_CODES = (429, 503)
+
+# Upper bound on how long a single Retry-After header may make us wait (seconds)
+MAX_RETRY_AFTER = 60
+
+# Connection pool of sessions created by the client, which is shared between
+# worker threads: hosts kept, and keep-alive connections kept per host
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+
+def _honor_retry_after(details: dict[str, Any]) -> None:
+    """Extend a backoff wait to honor the server's Retry-After header.
+
+    Args:
+        details: Backoff event details, including the raised exception and the
+            wait time backoff has chosen
+    """
+    retry_after = getattr(details.get("exception"), "retry_after", None)
+    if retry_after is None:
+        return
+
+    extra_wait = min(retry_after, MAX_RETRY_AFTER) - details["wait"]
+    if extra_wait > 0:
+        logger.debug(f"Server requested Retry-After {retry_after}s, waiting longer")
+        time.sleep(extra_wait)
+
 
 class OyezClient:
     """Base client for interacting with the Oyez API.
@@ -36,6 +70,8 @@ class OyezClient:
         timeout: int = 30,
         session: requests.Session | None = None,
         base_url: str | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_maxsize: int = POOL_MAXSIZE,
     ) -> None:
         """Initialize the Oyez API client.
 
@@ -43,9 +79,24 @@ class OyezClient:
             timeout: Request timeout in seconds
             session: Optional requests session to use for API calls
             base_url: Optional custom base URL (primarily for testing)
+            circuit_breaker: Optional circuit breaker shared with other clients
+                (default: a new breaker for this client)
+            pool_maxsize: Keep-alive connections kept per host by the session
+                the client creates; set it to at least the number of threads
+                sharing the client. Ignored when a session is provided.
         """
         self.timeout = timeout
-        self.session = session or requests.Session()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        if session is None:
+            # Pool enough keep-alive connections for concurrent callers, so
+            # requests skip the TCP and TLS handshakes after the first one
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS, pool_maxsize=pool_maxsize
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
 
         # Allow overriding base URL (for testing)
         self.base_url = base_url or self.BASE_URL
@@ -77,17 +128,83 @@ class OyezClient:
 
         return f"{self.base_url}/{url_or_path}"
 
+    def get(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any] | list:
+        """Make a GET request to the API with retries and rate limiting.
+
+        Requests fail fast without being sent while the circuit breaker is open
+        after repeated connection failures or server errors.
+
+        Args:
+            endpoint: API endpoint path (without base URL)
+            params: Optional query parameters
+
+        Returns
+        -------
+            JSON response as a dictionary or list
+
+        Raises
+        ------
+            CircuitOpenError: If the API has been failing and the request was skipped
+            OyezApiConnectionError: If connection to the API fails
+            OyezApiResponseError: If the API returns an error response
+            OyezResourceNotFoundError: If the requested resource is not found
+            RateLimitError: If the API keeps throttling requests after all retries
+        """
+        if not self.circuit_breaker.allow_request():
+            raise CircuitOpenError(
+                f"Skipping request to {endpoint}: Oyez API is failing repeatedly"
+            )
+
+        try:
+            result = self._get(endpoint, params)
+        except OyezApiConnectionError:
+            self.circuit_breaker.record_failure()
+            raise
+        except OyezApiError as e:
+            if self._is_server_error(e):
+                self.circuit_breaker.record_failure()
+            else:
+                # The server answered, even if not with what we asked for
+                self.circuit_breaker.record_success()
+            raise
+        self.circuit_breaker.record_success()
+        return result
+
+    @staticmethod
+    def _is_server_error(error: OyezApiError) -> bool:
+        """Check whether an API error was caused by a 5xx response.
+
+        Args:
+            error: The error raised for the request
+
+        Returns
+        -------
+            True if the underlying HTTP response had a server error status,
+            including 503 responses raised as RateLimitError
+        """
+        if isinstance(error, RateLimitError):
+            return error.status_code is not None and error.status_code >= 500
+        cause = error.__cause__
+        return (
+            isinstance(cause, requests.exceptions.HTTPError)
+            and cause.response is not None
+            and cause.response.status_code >= 500
+        )
+
     @backoff.on_exception(
         backoff.expo,
-        (requests.exceptions.RequestException, RateLimitException),
+        (requests.exceptions.RequestException, RateLimitException, RateLimitError),
         max_tries=5,
         jitter=backoff.full_jitter,
+        on_backoff=_honor_retry_after,
     )
     @limits(calls=1, period=1)  # Maximum 1 request per second
-    def get(
+    def _get(
         self, endpoint: str, params: dict[str, Any] | None = None
     ) -> dict[str, Any] | list:
-        """Make a GET request to the API with retries and rate limiting.
+        """Send a GET request to the API with retries and rate limiting.
 
         Args:
             endpoint: API endpoint path (without base URL)
@@ -102,6 +219,7 @@ class OyezClient:
             OyezApiConnectionError: If connection to the API fails
             OyezApiResponseError: If the API returns an error response
             OyezResourceNotFoundError: If the requested resource is not found
+            RateLimitError: If the API keeps throttling requests after all retries
         """
         url = self._normalize_url(endpoint)
         logger.debug(f"Making GET request to {url} with params: {params}")
@@ -113,11 +231,19 @@ class OyezClient:
             if response.status_code == 404:
                 raise OyezResourceNotFoundError(f"Resource not found: {url}")
 
+            if response.status_code in THROTTLE_STATUS_CODES:
+                raise RateLimitError(
+                    f"Oyez API throttled request to {url} "
+                    f"(status {response.status_code})",
+                    retry_after=self._parse_retry_after(response),
+                    status_code=response.status_code,
+                )
+
             response.raise_for_status()
 
             # Parse JSON response
             try:
-                return response.json()
+                return json_codec.loads(response.content)
             except ValueError as e:
                 raise OyezApiResponseError(f"Failed to parse JSON response: {e}") from e
 
@@ -134,6 +260,26 @@ class OyezClient:
             else:
                 raise OyezApiError(f"Error making request to Oyez API: {e}") from e
 
+    @staticmethod
+    def _parse_retry_after(response: requests.Response) -> int | None:
+        """Extract the Retry-After delay from a response.
+
+        Args:
+            response: The HTTP response
+
+        Returns
+        -------
+            The delay in seconds, or None if the header is missing or not numeric
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is None:
+            return None
+        try:
+            return max(0, int(retry_after))
+        except ValueError:
+            # HTTP-date values are rare for this API; fall back to plain backoff
+            return None
+
     def head(self, url: str) -> bool:
         """Make a HEAD request to verify a URL is accessible.
 
@@ -6,9 +6,13 @@ It handles the complexities of paginating through API responses with consistent
 
 import copy
 import logging
+import random
+import time
 from collections.abc import Generator
 from typing import Any, TypeVar, Union, cast
 
+from ..exceptions.api_exceptions import OyezApiConnectionError
+
 # Create a generic type variable for API response types
 T = TypeVar("T")
 JsonResponse = Union[dict[str, Any], list[dict[str, Any]], list[Any]]
@@ -28,11 +32,20 @@ class PaginationMixin:
         continue_pagination_on_partial_page: If True, continue pagination even when
             receiving a partial page (fewer items than per_page). This is primarily
             used for testing where the mock needs to serve all defined responses.
+        page_retry_attempts: Number of times a page is re-requested after a
+            connection error, so one transient failure doesn't abort the whole
+            enumeration.
+        page_retry_base_delay: Base delay in seconds for the exponential backoff
+            (with full jitter) between page retries.
     """
 
     # Default behavior is to stop on partial pages (real-world APIs)
     continue_pagination_on_partial_page = False
 
+    # Transient connection errors are retried before pagination gives up
+    page_retry_attempts = 3
+    page_retry_base_delay = 1.0
+
     def get_page_resource(
         self, endpoint: str, params: dict[str, Any] | None = None, page: int = 0
     ) -> JsonResponse:
@@ -47,6 +60,11 @@ class PaginationMixin:
         -------
             The JSON response for the requested page
 
+        Raises
+        ------
+            OyezApiConnectionError: If the page still cannot be fetched after
+                page_retry_attempts retries
+
         Note:
             This method assumes the API uses the 'page' query parameter for pagination.
             The page parameter will override any existing 'page' in params.
@@ -59,13 +77,25 @@ class PaginationMixin:
 
         # Make the request using the client's get method
         logger.debug(f"Requesting page {page} from {endpoint}")
-        try:
-            return self.get(endpoint, params=params)  # type: ignore
-        except StopIteration:
-            # Handle the case where a mock's side_effect list is exhausted
-            # This allows tests to define only the pages they care about
-            logger.debug(f"No more mock responses available for page {page}")
-            return []
+        attempt = 0
+        while True:
+            try:
+                return self.get(endpoint, params=params)  # type: ignore
+            except StopIteration:
+                # Handle the case where a mock's side_effect list is exhausted
+                # This allows tests to define only the pages they care about
+                logger.debug(f"No more mock responses available for page {page}")
+                return []
+            except OyezApiConnectionError as e:
+                if attempt >= self.page_retry_attempts:
+                    raise
+                delay = random.uniform(0, self.page_retry_base_delay * 2**attempt)
+                attempt += 1
+                logger.warning(
+                    f"Retrying page {page} from {endpoint} in {delay:.2f}s "
+                    f"(attempt {attempt}/{self.page_retry_attempts}): {e}"
+                )
+                time.sleep(delay)
 
     def iter_paginated_resource(
         self, endpoint: str, params: dict[str, Any] | None = None
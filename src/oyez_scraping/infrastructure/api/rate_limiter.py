@@ -170,8 +170,13 @@ class AdaptiveRateLimiter:
                     time.sleep(self._apply_jitter(self.current_delay))
 
                 elif retries <= self.max_retries:
-                    # Other error - retry with backoff, but less aggressive
-                    wait_time = self.min_delay * (1.5 ** (retries - 1))
+                    # Other error - retry with capped exponential backoff, but
+                    # less aggressive. Full jitter spreads out callers that
+                    # failed together so they don't all retry at once.
+                    wait_time = random.uniform(
+                        0,
+                        min(self.max_delay, self.min_delay * (1.5 ** (retries - 1))),
+                    )
 
                     logger.warning(
                         f"Error for {endpoint_key}: {e}. "
@@ -179,7 +184,7 @@ class AdaptiveRateLimiter:
                         f"Retry {retries}/{self.max_retries}"
                     )
 
-                    time.sleep(self._apply_jitter(wait_time))
+                    time.sleep(wait_time)
                 else:
                     # Max retries reached for non-rate-limit error
                     logger.error(f"Max retries reached for {endpoint_key}: {e}")
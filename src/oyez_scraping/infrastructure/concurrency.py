@@ -0,0 +1,46 @@
+"""Concurrency helpers for the Oyez scraping project.
+
+This module provides helpers for running many small tasks on a thread pool
+without queueing all of them up front.
+"""
+
+import itertools
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def submit_bounded(
+    executor: Executor,
+    fn: Callable[[T], Any],
+    items: Iterable[T],
+    max_pending: int,
+) -> Iterator[Future[Any]]:
+    """Submit a task per item, keeping at most max_pending tasks in flight.
+
+    Submitting every item at once holds a future per item and fills the
+    executor's work queue; here a new item is only submitted when a pending
+    task completes, so memory use stays proportional to max_pending.
+
+    Args:
+        executor: The executor to submit tasks to
+        fn: The function to call with each item
+        items: The items to process, consumed lazily
+        max_pending: Maximum number of submitted but unfinished tasks
+
+    Yields
+    ------
+        The future of each task, in completion order
+    """
+    item_iter = iter(items)
+    pending = {
+        executor.submit(fn, item)
+        for item in itertools.islice(item_iter, max(1, max_pending))
+    }
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for item in itertools.islice(item_iter, len(done)):
+            pending.add(executor.submit(fn, item))
+        yield from done
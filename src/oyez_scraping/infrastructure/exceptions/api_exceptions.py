@@ -23,6 +23,16 @@ class OyezApiResponseError(OyezApiError):
     pass
 
 
+class CircuitOpenError(OyezApiError):
+    """Exception raised when requests are skipped because the Oyez API is down.
+
+    This is deliberately not an OyezApiConnectionError, so callers that retry
+    connection errors fail fast instead of retrying against an open circuit.
+    """
+
+    pass
+
+
 class OyezResourceNotFoundError(OyezApiError):
     """Exception raised when a resource is not found in the Oyez API."""
 
@@ -52,15 +62,22 @@ class NetworkError(OyezApiError):
 class RateLimitError(OyezApiError):
     """Exception raised when the API rate limit is exceeded."""
 
-    def __init__(self, message: str, retry_after: int | None = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        retry_after: int | None = None,
+        status_code: int | None = None,
+    ) -> None:
         """Initialize RateLimitError.
 
         Args:
             message: Error message
             retry_after: Seconds to wait before retrying (if provided by API)
+            status_code: HTTP status code of the throttling response (if any)
         """
         super().__init__(message)
         self.retry_after = retry_after
+        self.status_code = status_code
 
 
 class ResponseFormatError(OyezApiError):
@@ -0,0 +1,58 @@
+"""JSON encoding and decoding helpers for the Oyez scraping project.
+
+This module uses orjson when it is installed, which is several times faster
+than the standard library for the large case payloads returned by the Oyez API,
+and falls back to the standard json module otherwise. Install the ``fast``
+extra (``pip install oyez-scraping[fast]``) to get it.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data: The JSON document as bytes or text
+
+    Returns
+    -------
+        The decoded Python object
+
+    Raises
+    ------
+        ValueError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any, indent: int | None = None) -> bytes:
+    """Encode an object as UTF-8 JSON.
+
+    Args:
+        data: The object to encode
+        indent: Number of spaces for indentation (None for compact output)
+
+    Returns
+    -------
+        The encoded JSON document
+
+    Raises
+    ------
+        TypeError: If the object cannot be serialized
+    """
+    # orjson only supports compact output or two-space indentation
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
@@ -24,16 +24,15 @@ def format_time(seconds: float) -> str:
     if seconds < 60:
         return f"{int(seconds):02d}s"
 
-    minutes, seconds = divmod(seconds, 60)
-    if minutes < 60:
-        return f"{int(minutes):02d}m {int(seconds):02d}s"
-
+    # Truncate once and split with integer arithmetic only
+    minutes, secs = divmod(int(seconds), 60)
     hours, minutes = divmod(minutes, 60)
-    if hours < 24:
-        return f"{int(hours):02d}h {int(minutes):02d}m {int(seconds):02d}s"
-
     days, hours = divmod(hours, 24)
-    return f"{int(days)}d {int(hours):02d}h {int(minutes):02d}m {int(seconds):02d}s"
+    if days:
+        return f"{days}d {hours:02d}h {minutes:02d}m {secs:02d}s"
+    if hours:
+        return f"{hours:02d}h {minutes:02d}m {secs:02d}s"
+    return f"{minutes:02d}m {secs:02d}s"
 
 
 class ProgressMonitor:
@@ -136,11 +135,9 @@ class ProgressMonitor:
 
             # Continue until stop is signaled
             while not self.stop_event.is_set():
-                # Sleep for the update interval, checking stop flag periodically
-                for _ in range(int(self.update_interval * 10)):
-                    if self.stop_event.is_set():
-                        return
-                    time.sleep(0.1)
+                # Block until the next update is due, waking early only on stop
+                if self.stop_event.wait(self.update_interval):
+                    return
 
                 # Calculate elapsed time
                 now = time.time()
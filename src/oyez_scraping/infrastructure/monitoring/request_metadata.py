@@ -31,6 +31,21 @@ class RequestMetadata:
         pagination_info: Information about pagination for this request
     """
 
+    # One instance is created per tracked request, so skip the per-instance dict
+    __slots__ = (
+        "error",
+        "headers",
+        "method",
+        "pagination_info",
+        "params",
+        "related_file",
+        "request_id",
+        "response_status",
+        "response_time_ms",
+        "timestamp",
+        "url",
+    )
+
     def __init__(
         self,
         url: str,
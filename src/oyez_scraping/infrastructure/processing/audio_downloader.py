@@ -7,6 +7,7 @@ effective caching.
 
 import hashlib
 import logging
+import re
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any
@@ -275,8 +276,6 @@ class AudioDownloader:
         path = parsed_url.path
 
         # Check for file extension in the path
-        import re
-
         match = re.search(r"\.([a-zA-Z0-9]+)(?:\?|$)", path)
         if match:
             return match.group(1).lower()
@@ -5,6 +5,10 @@ FLAC format. It wraps torchaudio functionality with appropriate error handling a
 normalization.
 """
 
+import functools
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import torch
@@ -35,16 +39,17 @@ def save_flac(
         AudioProcessingError: If there's an error during the save operation.
     """
     try:
-        # Normalize samples to the range [0, 1]
-        samples = samples - samples.min()
-        max_val = samples.max()
-        # Avoid division by zero if all samples are the same
-        if max_val > 0:
-            samples = samples / max_val
-
-        # Scale to the appropriate bit depth for FLAC
+        # Map samples from [min, max] to [0, max_int_value] with one shifted
+        # copy scaled in place, leaving the caller's tensor untouched
         max_int_value = 2 ** (bits_per_sample - 1) - 1
-        samples = (samples * max_int_value).to(torch.int32)
+        min_val = samples.min()
+        value_range = samples.max() - min_val
+        # Avoid division by zero if all samples are the same
+        scale = max_int_value / value_range if value_range > 0 else max_int_value
+        shifted = samples - min_val
+        if not shifted.is_floating_point():
+            shifted = shifted.float()
+        samples = shifted.mul_(scale).to(torch.int32)
 
         # Ensure the path is a string as required by torchaudio
         str_path = str(file_path)
@@ -67,11 +72,15 @@ def save_flac(
         ) from e
 
 
-def load_flac(file_path: str | Path) -> tuple[torch.Tensor, int]:
+def load_flac(
+    file_path: str | Path, frame_offset: int = 0, num_frames: int = -1
+) -> tuple[torch.Tensor, int]:
     """Load audio data from a FLAC file with appropriate denormalization.
 
     Args:
         file_path: Path to the FLAC file to load.
+        frame_offset: Number of frames to skip before the loaded range.
+        num_frames: Maximum number of frames to load (-1 loads to the end).
 
     Returns
     -------
@@ -88,7 +97,13 @@ def load_flac(file_path: str | Path) -> tuple[torch.Tensor, int]:
         str_path = str(file_path)
 
         # Load the audio without normalization to preserve bit depth
-        samples, sample_rate = torchaudio.load(str_path, normalize=False, format="flac")
+        samples, sample_rate = torchaudio.load(
+            str_path,
+            frame_offset=frame_offset,
+            num_frames=num_frames,
+            normalize=False,
+            format="flac",
+        )
 
         # Normalize the samples to float32 in the range [-1, 1]
         # We use a conservative divisor to avoid clipping
@@ -102,7 +117,11 @@ def load_flac(file_path: str | Path) -> tuple[torch.Tensor, int]:
 
 
 def load(
-    file_path: str | Path, sample_rate: int | None = None, normalize: bool = True
+    file_path: str | Path,
+    sample_rate: int | None = None,
+    normalize: bool = True,
+    frame_offset: int = 0,
+    num_frames: int = -1,
 ) -> tuple[torch.Tensor, int]:
     """Load audio data from various audio formats.
 
@@ -111,6 +130,9 @@ def load(
         sample_rate: Expected sampling rate. If provided, the function will verify
             that the loaded audio matches this rate.
         normalize: Whether to normalize the audio samples (default: True).
+        frame_offset: Number of frames to skip before the loaded range.
+        num_frames: Maximum number of frames to load (-1 loads to the end).
+            Only the requested range is decoded.
 
     Returns
     -------
@@ -128,10 +150,14 @@ def load(
 
         # Use the appropriate loading method based on file extension
         if file_path.suffix.lower() == ".flac":
-            samples, sr = load_flac(file_path)
+            samples, sr = load_flac(
+                file_path, frame_offset=frame_offset, num_frames=num_frames
+            )
         else:
             # For other formats, use the standard torchaudio loader
-            samples, sr = torchaudio.load(str(file_path))
+            samples, sr = torchaudio.load(
+                str(file_path), frame_offset=frame_offset, num_frames=num_frames
+            )
 
         # Verify sample rate if expected rate is provided
         if sample_rate is not None and sr != sample_rate:
@@ -146,11 +172,11 @@ def load(
 
         # Apply normalization if requested
         if normalize:
-            # Z-score normalization
-            samples = samples - samples.mean()
-            std = samples.std()
+            # Z-score normalization, in place on the freshly decoded tensor
+            std, mean = torch.std_mean(samples)
+            samples.sub_(mean)
             if std > 0:  # Avoid division by zero
-                samples = samples / std
+                samples.div_(std)
 
         return samples, sr
     except AudioProcessingError:
@@ -218,6 +244,72 @@ def get_info(file_path: str | Path) -> AudioMetaData:
         ) from e
 
 
+@functools.lru_cache(maxsize=32)
+def _get_info_cached(path: str, _mtime_ns: int, _size: int) -> AudioMetaData:
+    """Get audio file metadata, memoized per file version.
+
+    Args:
+        path: Path to the audio file.
+        _mtime_ns: Modification time of the file, only part of the cache key so
+            that changed files are read again.
+        _size: Size of the file in bytes, a second part of the cache key.
+
+    Returns
+    -------
+        AudioMetaData object containing file metadata.
+    """
+    return get_info(path)
+
+
+def _get_segment_info(file_path: str | Path) -> AudioMetaData:
+    """Get audio file metadata, reusing it across segments of the same file.
+
+    Args:
+        file_path: Path to the audio file.
+
+    Returns
+    -------
+        AudioMetaData object containing file metadata.
+
+    Raises
+    ------
+        AudioProcessingError: If there's an error retrieving file information.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        # Let get_info report the missing or unreadable file
+        return get_info(file_path)
+    return _get_info_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _validate_time_range(
+    file_path: str | Path, start_time: float, end_time: float
+) -> None:
+    """Check that a segment time range is well formed.
+
+    Args:
+        file_path: Path to the source audio file, used in error messages.
+        start_time: Start time of the segment in seconds.
+        end_time: End time of the segment in seconds.
+
+    Raises
+    ------
+        AudioProcessingError: If the start time is negative or the end time is
+            not after the start time.
+    """
+    if start_time < 0:
+        raise AudioProcessingError(
+            f"Invalid start time: {start_time}. Must be >= 0", file_path=str(file_path)
+        )
+
+    if end_time <= start_time:
+        raise AudioProcessingError(
+            f"Invalid time range: end time ({end_time}) must be > start time ({start_time})",
+            file_path=str(file_path),
+        )
+
+
 def extract_segment(
     file_path: str | Path,
     output_path: str | Path,
@@ -239,34 +331,38 @@ def extract_segment(
         AudioProcessingError: If there's an error during extraction or if the
             specified time range is invalid.
     """
-    if start_time < 0:
-        raise AudioProcessingError(
-            f"Invalid start time: {start_time}. Must be >= 0", file_path=str(file_path)
-        )
-
-    if end_time <= start_time:
-        raise AudioProcessingError(
-            f"Invalid time range: end time ({end_time}) must be > start time ({start_time})",
-            file_path=str(file_path),
-        )
+    _validate_time_range(file_path, start_time, end_time)
 
     try:
-        # Load the audio file
-        samples, sr = load(file_path, sample_rate=sample_rate, normalize=False)
+        # Read the header to locate the segment without decoding the audio. The
+        # header is only read once when many segments come from the same file.
+        info = _get_segment_info(file_path)
+        sr = info.sample_rate
 
         # Calculate sample indices for the segment
         start_sample = int(start_time * sr)
         end_sample = int(end_time * sr)
 
-        # Validate sample indices
-        if end_sample > samples.shape[1]:
+        # Validate sample indices (some formats report 0 frames when unknown)
+        if info.num_frames and end_sample > info.num_frames:
             raise AudioProcessingError(
-                f"End time ({end_time}s) exceeds audio duration ({samples.shape[1] / sr:.2f}s)",
+                f"End time ({end_time}s) exceeds audio duration ({info.num_frames / sr:.2f}s)",
                 file_path=str(file_path),
             )
 
-        # Extract the segment
-        segment = samples[:, start_sample:end_sample]
+        # Decode only the segment rather than the whole file
+        segment, sr = load(
+            file_path,
+            sample_rate=sample_rate,
+            normalize=False,
+            frame_offset=start_sample,
+            num_frames=end_sample - start_sample,
+        )
+        if segment.shape[1] < end_sample - start_sample:
+            raise AudioProcessingError(
+                f"End time ({end_time}s) exceeds audio duration ({(start_sample + segment.shape[1]) / sr:.2f}s)",
+                file_path=str(file_path),
+            )
 
         # Save the segment
         save(output_path, segment, sr)
@@ -277,3 +373,62 @@ def extract_segment(
         raise AudioProcessingError(
             f"Failed to extract audio segment: {e!s}", file_path=str(file_path)
         ) from e
+
+
+def extract_segments(
+    file_path: str | Path,
+    segments: Sequence[tuple[str | Path, float, float]],
+    sample_rate: int | None = None,
+    max_workers: int | None = None,
+) -> None:
+    """Extract many segments from one audio file, decoding it only once.
+
+    Segments are sliced as views of the decoded waveform and saved in
+    parallel, since encoding releases the GIL. Prefer extract_segment for a
+    single short segment, which only decodes the requested range.
+
+    Args:
+        file_path: Path to the source audio file.
+        segments: (output_path, start_time, end_time) for each segment, with
+            times in seconds.
+        sample_rate: Optional sample rate override for the output files.
+        max_workers: Maximum number of segments saved concurrently
+            (default: the executor's default).
+
+    Raises
+    ------
+        AudioProcessingError: If there's an error during extraction or if any
+            specified time range is invalid.
+    """
+    for _, start_time, end_time in segments:
+        _validate_time_range(file_path, start_time, end_time)
+
+    if not segments:
+        return
+
+    try:
+        samples, sr = load(file_path, sample_rate=sample_rate, normalize=False)
+        num_frames = samples.shape[1]
+
+        # Validate every segment before writing any of them
+        output_paths = []
+        views = []
+        for output_path, start_time, end_time in segments:
+            end_sample = int(end_time * sr)
+            if end_sample > num_frames:
+                raise AudioProcessingError(
+                    f"End time ({end_time}s) exceeds audio duration ({num_frames / sr:.2f}s)",
+                    file_path=str(file_path),
+                )
+            output_paths.append(output_path)
+            views.append(samples[:, int(start_time * sr) : end_sample])
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(save, output_paths, views, [sr] * len(views)))
+    except AudioProcessingError:
+        # Re-raise AudioProcessingError exceptions directly
+        raise
+    except Exception as e:
+        raise AudioProcessingError(
+            f"Failed to extract audio segments: {e!s}", file_path=str(file_path)
+        ) from e
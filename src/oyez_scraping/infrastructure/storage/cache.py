@@ -4,10 +4,12 @@ This module provides a caching system for raw Oyez data to avoid
 re-scraping already fetched content.
 """
 
+import contextlib
 import hashlib
 import logging
 import threading
 import time
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +19,9 @@ from .filesystem import FilesystemStorage
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Longest time index changes are held back inside a batch before being saved
+INDEX_BATCH_FLUSH_SECONDS = 30.0
+
 
 class RawDataCache:
     """Cache manager for raw Oyez data.
@@ -37,6 +42,12 @@ class RawDataCache:
         # Create a lock for thread safety
         self.lock = threading.RLock()
 
+        # Nesting depth of batch() blocks and whether the index has unsaved
+        # changes; index writes are deferred while a batch is open
+        self._batch_depth = 0
+        self._index_dirty = False
+        self._index_saved_at = 0.0
+
         # Create cache directories
         self._create_cache_structure()
 
@@ -105,12 +116,52 @@ class RawDataCache:
         """
         try:
             with self.lock:
+                now = time.time()
+                if (
+                    index is None
+                    and self._batch_depth
+                    and now - self._index_saved_at < INDEX_BATCH_FLUSH_SECONDS
+                ):
+                    self._index_dirty = True
+                    return
                 index = index or self.cache_index
-                index["metadata"]["last_updated"] = time.time()
+                index["metadata"]["last_updated"] = now
                 self.storage.write_json(self.index_path, index)
+                self._index_dirty = False
+                self._index_saved_at = now
         except StorageError as e:
             raise CacheError(f"Failed to save cache index: {e}") from e
 
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer writing the cache index until the end of a block.
+
+        The index is rewritten in full on every store, which makes scraping a
+        term quadratic in the number of cached items. Inside a batch, stores
+        still write their data files immediately but only mark the index as
+        changed; it is saved when the outermost batch exits, and at most every
+        INDEX_BATCH_FLUSH_SECONDS meanwhile so a long run that crashes only
+        loses recent index entries. Batches may be nested and shared between
+        threads.
+
+        Yields
+        ------
+            None
+
+        Raises
+        ------
+            CacheError: If the index cannot be saved when the batch exits
+        """
+        with self.lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self.lock:
+                self._batch_depth -= 1
+                if not self._batch_depth and self._index_dirty:
+                    self._save_index()
+
     def case_exists(self, case_id: str) -> bool:
         """Check if a case exists in the cache.
 
@@ -124,6 +175,25 @@ class RawDataCache:
         with self.lock:
             return case_id in self.cache_index["cases"]
 
+    def is_case_fresh(self, case_id: str, max_age: float | None = None) -> bool:
+        """Check if a case is cached and younger than a maximum age.
+
+        Args:
+            case_id: The ID of the case to check
+            max_age: Maximum age in seconds (None means cached entries never expire)
+
+        Returns
+        -------
+            True if the case is cached and still fresh, False otherwise
+        """
+        with self.lock:
+            entry = self.cache_index["cases"].get(case_id)
+            if entry is None:
+                return False
+            if max_age is None:
+                return True
+            return time.time() - entry.get("cached_at", 0) <= max_age
+
     def get_case_data(self, case_id: str) -> dict[str, Any]:
         """Get case data from the cache.
 
@@ -244,25 +314,84 @@ class RawDataCache:
             self.storage.write_bytes(audio_path, audio_data)
 
             # Update the cache index
-            with self.lock:
-                self.cache_index["audio_files"][audio_id] = {
-                    "path": str(audio_path.relative_to(self.cache_dir)),
-                    "cached_at": time.time(),
-                    "media_type": media_type,
-                    "case_id": case_id,
-                }
+            self._index_audio(audio_id, audio_path, case_id, media_type)
+
+            logger.debug(f"Cached audio data for {audio_id}")
+        except StorageError as e:
+            raise CacheError(f"Failed to store audio data: {e}") from e
 
-                # Update the case entry if a case_id was provided
-                if case_id and case_id in self.cache_index["cases"]:
-                    self.cache_index["cases"][case_id]["has_audio"] = True
+    def store_audio_stream(
+        self,
+        audio_id: str,
+        chunks: Iterable[bytes],
+        case_id: str | None = None,
+        media_type: str = "unknown",
+    ) -> int:
+        """Store audio data in the cache as it is downloaded.
 
-                # Save the updated index
-                self._save_index()
+        Unlike store_audio_data, the audio is written to disk chunk by chunk and
+        never held in memory as a whole. The audio is only added to the index
+        once all chunks were written.
 
-            logger.debug(f"Cached audio data for {audio_id}")
+        Args:
+            audio_id: The ID of the audio
+            chunks: Iterable of binary chunks of the audio, in order
+            case_id: Optional ID of the associated case
+            media_type: Type of media (e.g., "mp3", "flac")
+
+        Returns
+        -------
+            The number of bytes stored
+
+        Raises
+        ------
+            CacheError: If the audio data cannot be stored
+        """
+        try:
+            # Generate a path for the audio file
+            audio_path = self._get_audio_path(audio_id, media_type)
+
+            # Stream the audio data to disk
+            size = self.storage.write_stream(audio_path, chunks)
+
+            # Update the cache index
+            self._index_audio(audio_id, audio_path, case_id, media_type)
+
+            logger.debug(f"Cached {size} bytes of audio data for {audio_id}")
+            return size
         except StorageError as e:
             raise CacheError(f"Failed to store audio data: {e}") from e
 
+    def _index_audio(
+        self, audio_id: str, audio_path: Path, case_id: str | None, media_type: str
+    ) -> None:
+        """Record a stored audio file in the cache index.
+
+        Args:
+            audio_id: The ID of the audio
+            audio_path: Path of the stored audio file
+            case_id: Optional ID of the associated case
+            media_type: Type of media (e.g., "mp3", "flac")
+
+        Raises
+        ------
+            CacheError: If the index cannot be saved
+        """
+        with self.lock:
+            self.cache_index["audio_files"][audio_id] = {
+                "path": str(audio_path.relative_to(self.cache_dir)),
+                "cached_at": time.time(),
+                "media_type": media_type,
+                "case_id": case_id,
+            }
+
+            # Update the case entry if a case_id was provided
+            if case_id and case_id in self.cache_index["cases"]:
+                self.cache_index["cases"][case_id]["has_audio"] = True
+
+            # Save the updated index
+            self._save_index()
+
     def store_case_list(self, list_name: str, case_list: list[dict[str, Any]]) -> None:
         """Store a list of cases in the cache.
 
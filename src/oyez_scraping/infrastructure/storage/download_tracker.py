@@ -4,12 +4,13 @@ This module provides functionality for tracking the state of downloads,
 particularly for handling failed downloads and implementing retry logic.
 """
 
-import json
 import logging
 import time
 from pathlib import Path
 from typing import Any
 
+from .. import json_codec
+
 
 class DownloadTracker:
     """Track and manage the state of downloads, including retry logic for failed items.
@@ -57,9 +58,8 @@ class DownloadTracker:
         try:
             if self.tracker_path.exists():
                 try:
-                    with open(self.tracker_path, encoding="utf-8") as f:
-                        data = json.load(f)
-                        self.failed_items = data.get("failed_items", {})
+                    data = json_codec.loads(self.tracker_path.read_bytes())
+                    self.failed_items = data.get("failed_items", {})
                 except Exception as e:
                     self.logger.warning(
                         f"Failed to load download tracker from {self.tracker_path}: {e}"
@@ -178,20 +178,16 @@ class DownloadTracker:
             Dictionary with statistics including total_failed, retriable, and permanent_failures
         """
         total_failed = len(self.failed_items)
-        retriable = 0
-        permanent_failures = 0
-
-        for item_info in self.failed_items.values():
-            attempts = item_info.get("attempts", 0)
-            if attempts <= self.max_retry_attempts:
-                retriable += 1
-            else:
-                permanent_failures += 1
+        retriable = sum(
+            item_info.get("attempts", 0) <= self.max_retry_attempts
+            for item_info in self.failed_items.values()
+        )
 
+        # Every failed item is either retriable or a permanent failure
         return {
             "total_failed": total_failed,
             "retriable": retriable,
-            "permanent_failures": permanent_failures,
+            "permanent_failures": total_failed - retriable,
         }
 
     def reset(self) -> None:
@@ -6,9 +6,11 @@ with a focus on JSON data handling and proper error handling.
 
 import json
 import os
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any, TypeVar
 
+from .. import json_codec
 from ..exceptions.storage_exceptions import (
     DirectoryCreationError,
     FileReadError,
@@ -18,6 +20,9 @@ from ..exceptions.storage_exceptions import (
 # Type variable for generic JSON data
 T = TypeVar("T", dict[str, Any], list[Any], str, int, float, bool, None)
 
+# Buffer size for streamed writes, so small chunks are coalesced into few syscalls
+STREAM_BUFFER_SIZE = 128 * 1024
+
 
 class FilesystemStorage:
     """Filesystem storage implementation for reading and writing files."""
@@ -39,8 +44,7 @@ class FilesystemStorage:
         """
         try:
             file_path = Path(file_path)
-            with open(file_path, encoding="utf-8") as f:
-                return json.load(f)
+            return json_codec.loads(file_path.read_bytes())
         except json.JSONDecodeError as e:
             raise FileReadError(
                 f"Failed to parse JSON: {e}", file_path=str(file_path)
@@ -69,8 +73,8 @@ class FilesystemStorage:
             # Ensure the parent directory exists
             os.makedirs(file_path.parent, exist_ok=True)
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=indent, ensure_ascii=False)
+            with open(file_path, "wb") as f:
+                f.write(json_codec.dumps(data, indent=indent))
         except Exception as e:
             raise FileWriteError(
                 f"Failed to write JSON file: {e}", file_path=str(file_path)
@@ -156,6 +160,53 @@ class FilesystemStorage:
                 f"Failed to list files: {e}", file_path=str(directory_path)
             ) from e
 
+    @staticmethod
+    def get_directory_size(directory_path: str | Path) -> int:
+        """Calculate the total size of the files under a directory.
+
+        The tree is walked with os.scandir, whose entries carry the file type
+        from the directory listing, so each file costs a single stat() call.
+        Files removed while the walk is in progress are skipped.
+
+        Args:
+            directory_path: Path to the directory
+
+        Returns
+        -------
+            Total size in bytes
+
+        Raises
+        ------
+            FileReadError: If the directory cannot be read
+        """
+        total_size = 0
+        pending = [os.fspath(directory_path)]
+        try:
+            while pending:
+                path = pending.pop()
+                try:
+                    with os.scandir(path) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    pending.append(entry.path)
+                                elif entry.is_file(follow_symlinks=False):
+                                    total_size += entry.stat(
+                                        follow_symlinks=False
+                                    ).st_size
+                            except FileNotFoundError:
+                                continue
+                except FileNotFoundError:
+                    # Subdirectories may vanish mid-walk; the root must exist
+                    if path == os.fspath(directory_path):
+                        raise
+        except Exception as e:
+            raise FileReadError(
+                f"Failed to calculate directory size: {e}",
+                file_path=str(directory_path),
+            ) from e
+        return total_size
+
     @staticmethod
     def read_bytes(file_path: str | Path) -> bytes:
         """Read binary data from a file.
@@ -203,3 +254,58 @@ class FilesystemStorage:
             raise FileWriteError(
                 f"Failed to write binary file: {e}", file_path=str(file_path)
             ) from e
+
+    @staticmethod
+    def write_stream(file_path: str | Path, chunks: Iterable[bytes]) -> int:
+        """Write binary data to a file as it arrives, without holding it in memory.
+
+        The data is written to a temporary file next to the destination through
+        a STREAM_BUFFER_SIZE buffer and moved into place once complete, so an
+        interrupted stream never leaves a truncated file behind. Errors raised
+        while producing the chunks propagate unchanged.
+
+        Args:
+            file_path: Path where the file will be written
+            chunks: Iterable of binary chunks to write, in order
+
+        Returns
+        -------
+            The number of bytes written
+
+        Raises
+        ------
+            FileWriteError: If the file cannot be written
+        """
+        file_path = Path(file_path)
+        temp_path = file_path.with_name(f"{file_path.name}.part")
+        written = 0
+        try:
+            try:
+                os.makedirs(file_path.parent, exist_ok=True)
+                f = open(temp_path, "wb", buffering=STREAM_BUFFER_SIZE)  # noqa: SIM115
+            except OSError as e:
+                raise FileWriteError(
+                    f"Failed to write binary file: {e}", file_path=str(file_path)
+                ) from e
+
+            with f:
+                for chunk in chunks:
+                    try:
+                        f.write(chunk)
+                    except OSError as e:
+                        raise FileWriteError(
+                            f"Failed to write binary file: {e}",
+                            file_path=str(file_path),
+                        ) from e
+                    written += len(chunk)
+
+            try:
+                os.replace(temp_path, file_path)
+            except OSError as e:
+                raise FileWriteError(
+                    f"Failed to write binary file: {e}", file_path=str(file_path)
+                ) from e
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return written
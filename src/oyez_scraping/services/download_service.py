@@ -4,7 +4,7 @@ This module provides services for managing large download operations, including
 parallel processing, progress tracking, and automatic retrying of failed downloads.
 """
 
-import concurrent.futures
+import functools
 import logging
 import threading
 import time
@@ -12,14 +12,34 @@ from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, TypeVar
 
+from ..infrastructure.concurrency import submit_bounded
 from ..infrastructure.monitoring.progress import ProgressMonitor, format_time
 from ..infrastructure.storage.download_tracker import DownloadTracker
 from ..infrastructure.storage.filesystem import FilesystemStorage
-from ..services.raw_data_scraper import RawDataScraperService
+from ..services.raw_data_scraper import RawDataScraperService, deduplicate_cases
 
 # Type variable for self-referential type hints
 T = TypeVar("T", bound="DownloadService")
 
+# Case summary fields needed to scrape a case; the rest of each summary is dropped
+CASE_SUMMARY_FIELDS = ("term", "docket_number")
+
+# Seconds to wait between full cache size walks for each MB already cached
+CACHE_SIZE_WALK_SECONDS_PER_MB = 0.01
+
+
+def _project_case_summary(case: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a case list entry to the fields needed to scrape the case.
+
+    Args:
+        case: Case data from a case list
+
+    Returns
+    -------
+        A new dictionary containing only the fields in CASE_SUMMARY_FIELDS
+    """
+    return {field: case[field] for field in CASE_SUMMARY_FIELDS if field in case}
+
 
 class DownloadService:
     """Service for managing large download operations.
@@ -67,20 +87,76 @@ class DownloadService:
             max_retry_attempts=max_retry_attempts,
         )
 
-        # Initialize shared statistics
-        self.stats: dict[str, Any] = {
+        # Initialize shared statistics. They are only updated by the thread that
+        # drives a download, from its as_completed loops, so no lock is needed;
+        # the progress monitor reads the individual counters without locking.
+        self.stats: dict[str, int] = {
             "items_processed": 0,
             "audio_files_downloaded": 0,
             "errors": 0,
-            "lock": threading.Lock(),
         }
 
+        # Guards the processed_cases sets shared by _process_case workers
+        self._processed_cases_lock = threading.Lock()
+
         # Progress monitor will be initialized when needed
         self.progress_monitor: ProgressMonitor | None = None
 
-    def _get_current_stats(self) -> dict[str, Any]:
+        # Result of the last full cache size walk, used to estimate in between
+        self._cache_size_walked_at: float | None = None
+        self._cache_size_mb = 0.0
+        self._cache_size_audio_count = 0
+
+    def _get_cache_size_mb(self, audio_count: int, exact: bool = False) -> float:
+        """Get the size of the cache directory in megabytes.
+
+        Walking the cache gets slower as it grows, so the walk is repeated at
+        most every status interval, and less often the larger the cache is.
+        In between, the size is extrapolated from the number of cached audio
+        files using the average audio file size seen at the last walk.
+
+        Args:
+            audio_count: Number of audio files currently in the cache
+            exact: If True, always walk the cache directory
+
+        Returns
+        -------
+            Cache size in megabytes
+
+        Raises
+        ------
+            FileReadError: If the cache directory cannot be read
+        """
+        now = time.time()
+        walk_interval = max(
+            self.status_interval,
+            self._cache_size_mb * CACHE_SIZE_WALK_SECONDS_PER_MB,
+        )
+        if (
+            exact
+            or self._cache_size_walked_at is None
+            or now - self._cache_size_walked_at >= walk_interval
+        ):
+            self._cache_size_mb = self.storage.get_directory_size(self.cache_dir) / (
+                1024 * 1024
+            )
+            self._cache_size_walked_at = now
+            self._cache_size_audio_count = audio_count
+            return self._cache_size_mb
+
+        if self._cache_size_audio_count <= 0:
+            return self._cache_size_mb
+        mb_per_audio = self._cache_size_mb / self._cache_size_audio_count
+        new_audio = max(0, audio_count - self._cache_size_audio_count)
+        return self._cache_size_mb + new_audio * mb_per_audio
+
+    def _get_current_stats(self, exact_cache_size: bool = False) -> dict[str, Any]:
         """Get current statistics for progress monitoring.
 
+        Args:
+            exact_cache_size: If True, measure the cache size instead of
+                estimating it between periodic walks
+
         Returns
         -------
             Dictionary with current statistics
@@ -97,19 +173,17 @@ class DownloadService:
 
         # Calculate cache size
         try:
-            cache_size_mb = sum(
-                f.stat().st_size for f in self.cache_dir.glob("**/*") if f.is_file()
-            ) / (1024 * 1024)
-            stats["cache_size_mb"] = cache_size_mb
+            stats["cache_size_mb"] = self._get_cache_size_mb(
+                stats["audio_count"], exact=exact_cache_size
+            )
         except Exception as e:
             self.logger.debug(f"Unable to calculate cache size: {e}")
             stats["cache_size_mb"] = 0.0
 
         # Add stats from our internal tracking
-        with self.stats["lock"]:
-            stats["items_processed"] = self.stats["items_processed"]
-            stats["audio_files_downloaded"] = self.stats["audio_files_downloaded"]
-            stats["errors"] = self.stats["errors"]
+        stats["items_processed"] = self.stats["items_processed"]
+        stats["audio_files_downloaded"] = self.stats["audio_files_downloaded"]
+        stats["errors"] = self.stats["errors"]
 
         # Add download tracker stats
         tracker_stats = self.download_tracker.get_stats()
@@ -151,6 +225,10 @@ class DownloadService:
     ) -> tuple[bool, int]:
         """Process a single case with download tracking.
 
+        This never raises: any error is logged, recorded in the download tracker
+        when possible, and reported as a failed result, so the worker pools can
+        unpack results without their own exception handling.
+
         Args:
             case: Case data dictionary
             skip_audio: If True, skip audio file downloads
@@ -171,14 +249,15 @@ class DownloadService:
 
         case_id = f"{term}/{docket}"
 
-        # Skip if already processed (for parallel processing)
-        if processed_cases is not None and case_id in processed_cases:
-            self.logger.debug(f"Skipping already processed case {case_id}")
-            return True, 0
-
-        # Add to processed set if tracking
+        # Skip if already processed (for parallel processing). The check and the
+        # add happen under one lock so two workers cannot both claim a case.
         if processed_cases is not None:
-            processed_cases.add(case_id)
+            with self._processed_cases_lock:
+                already_processed = case_id in processed_cases
+                processed_cases.add(case_id)
+            if already_processed:
+                self.logger.debug(f"Skipping already processed case {case_id}")
+                return True, 0
 
         try:
             # Scrape the full case data
@@ -193,9 +272,7 @@ class DownloadService:
             audio_content = self.scraper.scrape_case_audio_content(case_data)
 
             # Count audio files
-            audio_count = 0
-            for content_list in audio_content.values():
-                audio_count += len(content_list)
+            audio_count = sum(map(len, audio_content.values()))
 
             self.logger.debug(
                 f"Scraped case {term}/{docket} with {audio_count} audio files"
@@ -208,9 +285,59 @@ class DownloadService:
         except Exception as e:
             self.logger.error(f"Error scraping case {case_id}: {e}")
             # Mark the case as failed in the tracker for later retry
-            self.download_tracker.mark_failed(case_id, case)
+            try:
+                self.download_tracker.mark_failed(case_id, case)
+            except Exception as tracker_error:
+                self.logger.error(
+                    f"Failed to record failed case {case_id}: {tracker_error}"
+                )
             return False, 0
 
+    def _download_cases(
+        self,
+        cases: list[dict[str, Any]],
+        *,
+        skip_audio: bool = False,
+        processed_cases: set[str] | None = None,
+    ) -> list[tuple[bool, int]]:
+        """Process cases on the worker pool and update the shared statistics.
+
+        Args:
+            cases: Case summaries to process
+            skip_audio: If True, skip audio file downloads
+            processed_cases: Optional set of already processed case IDs to avoid duplicates
+
+        Returns
+        -------
+            List of (success, audio_count) tuples, in completion order
+        """
+        process_case = functools.partial(
+            self._process_case, skip_audio=skip_audio, processed_cases=processed_cases
+        )
+
+        # Save the cache index once at the end rather than after every case, and
+        # only keep a couple of cases per worker queued at a time
+        with (
+            self.scraper.cache.batch(),
+            ThreadPoolExecutor(max_workers=self.max_workers) as executor,
+        ):
+            results = []
+            for future in submit_bounded(
+                executor, process_case, cases, 2 * self.max_workers
+            ):
+                # _process_case reports its own errors as failed results
+                success, audio_count = future.result()
+                results.append((success, audio_count))
+
+                # Update stats
+                if success:
+                    self.stats["items_processed"] += 1
+                else:
+                    self.stats["errors"] += 1
+                self.stats["audio_files_downloaded"] += audio_count
+
+        return results
+
     def download_term(self, term: str, *, skip_audio: bool = False) -> dict[str, Any]:
         """Download all cases for a specific term.
 
@@ -230,38 +357,13 @@ class DownloadService:
         try:
             self.logger.info(f"Downloading term {term}")
 
-            # Get all cases for the term
-            cases = self.scraper.scrape_term(term)
+            # Get all cases for the term, keeping only what is needed to scrape them
+            cases = deduplicate_cases(
+                [_project_case_summary(case) for case in self.scraper.scrape_term(term)]
+            )
 
             # Process each case in the term
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=self.max_workers
-            ) as executor:
-                futures = []
-                for case in cases:
-                    futures.append(
-                        executor.submit(self._process_case, case, skip_audio=skip_audio)
-                    )
-
-                # Wait for all futures to complete and update stats
-                results = []
-                for future in concurrent.futures.as_completed(futures):
-                    try:
-                        result = future.result()
-                        results.append(result)
-
-                        # Update stats
-                        success, audio_count = result
-                        with self.stats["lock"]:
-                            if success:
-                                self.stats["items_processed"] += 1
-                            else:
-                                self.stats["errors"] += 1
-                            self.stats["audio_files_downloaded"] += audio_count
-                    except Exception as e:
-                        self.logger.error(f"Exception in worker thread: {e}")
-                        with self.stats["lock"]:
-                            self.stats["errors"] += 1
+            results = self._download_cases(cases, skip_audio=skip_audio)
 
             # Count successes for reporting
             successes = sum(1 for success, _ in results if success)
@@ -307,20 +409,34 @@ class DownloadService:
             # Initial count of errors before processing
             initial_error_count = self.stats["errors"]
 
-            # Process each term sequentially
-            for term in terms:
-                try:
-                    self.download_term(term, skip_audio=skip_audio)
-                except Exception as e:
-                    self.logger.error(f"Failed to download term {term}: {e}")
-                    with self.stats["lock"]:
+            # Collect the cases of every term first and process them on a single
+            # worker pool, so that slow cases at the end of one term do not
+            # leave workers idle until the next term starts. The term case lists
+            # are fetched concurrently, and combined in the requested term order.
+            cases: list[dict[str, Any]] = []
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    term: executor.submit(self.scraper.scrape_term, term)
+                    for term in terms
+                }
+                for term, future in futures.items():
+                    try:
+                        cases.extend(
+                            _project_case_summary(case) for case in future.result()
+                        )
+                    except Exception as e:
+                        self.logger.error(f"Failed to download term {term}: {e}")
                         self.stats["errors"] += 1
+            cases = deduplicate_cases(cases)
+
+            self.logger.info(f"Found {len(cases)} cases in {len(terms)} terms")
+            self._download_cases(cases, skip_audio=skip_audio)
 
             # After all terms have been processed, retry any failed cases
             retry_stats = self._retry_failed_cases(skip_audio=skip_audio)
 
             # Get final statistics
-            final_stats = self._get_current_stats()
+            final_stats = self._get_current_stats(exact_cache_size=True)
 
             # Add elapsed time
             elapsed_time = time.time() - start_time
@@ -388,49 +504,28 @@ class DownloadService:
             # Initial count of errors before processing
             initial_error_count = self.stats["errors"]
 
-            # Get case list for all cases
-            case_list = self.scraper.scrape_all_cases()
+            # Get case list for all cases, keeping only what is needed to scrape them
+            case_list = deduplicate_cases(
+                [
+                    _project_case_summary(case)
+                    for case in self.scraper.scrape_all_cases()
+                ]
+            )
             self.logger.info(f"Found {len(case_list)} cases to download")
 
             # Keep track of processed cases (to avoid duplicates)
             processed_cases: set[str] = set()
 
             # Use thread pool for parallel processing
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all cases to the executor
-                futures = {
-                    executor.submit(
-                        self._process_case,
-                        case,
-                        skip_audio=skip_audio,
-                        processed_cases=processed_cases,
-                    ): case
-                    for case in case_list
-                }
-
-                # Process results as they complete
-                for future in concurrent.futures.as_completed(futures):
-                    try:
-                        success, audio_count = future.result()
-
-                        # Update stats
-                        with self.stats["lock"]:
-                            if success:
-                                self.stats["items_processed"] += 1
-                            else:
-                                self.stats["errors"] += 1
-                            self.stats["audio_files_downloaded"] += audio_count
-
-                    except Exception as e:
-                        self.logger.error(f"Exception in worker thread: {e}")
-                        with self.stats["lock"]:
-                            self.stats["errors"] += 1
+            self._download_cases(
+                case_list, skip_audio=skip_audio, processed_cases=processed_cases
+            )
 
             # After all cases have been processed, retry any failed cases
             retry_stats = self._retry_failed_cases(skip_audio=skip_audio)
 
             # Get final statistics
-            final_stats = self._get_current_stats()
+            final_stats = self._get_current_stats(exact_cache_size=True)
 
             # Add elapsed time
             elapsed_time = time.time() - start_time
@@ -540,35 +635,12 @@ class DownloadService:
             retry_stats["attempted"] += round_items_count
             self.logger.info(f"Retrying {round_items_count} failed items")
 
-            # Track successes in this round
-            round_successes = 0
-
             # Process each failed item
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = []
-                for _item_id, case in failed_items:
-                    futures.append(
-                        executor.submit(self._process_case, case, skip_audio=skip_audio)
-                    )
-
-                # Wait for all futures to complete and update stats
-                for future in concurrent.futures.as_completed(futures):
-                    try:
-                        success, audio_count = future.result()
-
-                        # Update stats
-                        with self.stats["lock"]:
-                            if success:
-                                self.stats["items_processed"] += 1
-                                round_successes += 1
-                                retry_stats["recovered"] += 1
-                            else:
-                                self.stats["errors"] += 1
-                            self.stats["audio_files_downloaded"] += audio_count
-                    except Exception as e:
-                        self.logger.error(f"Exception in worker thread: {e}")
-                        with self.stats["lock"]:
-                            self.stats["errors"] += 1
+            results = self._download_cases(
+                [case for _item_id, case in failed_items], skip_audio=skip_audio
+            )
+            round_successes = sum(1 for success, _ in results if success)
+            retry_stats["recovered"] += round_successes
 
             self.logger.info(
                 f"Retry round {retry_round} recovered {round_successes}/{round_items_count} items"
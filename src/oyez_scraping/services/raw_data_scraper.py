@@ -4,9 +4,13 @@ This module provides a service for scraping and caching raw data from the Oyez A
 including case metadata, audio files, and transcripts.
 """
 
+import datetime
+import functools
 import logging
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -14,6 +18,7 @@ from urllib.parse import urlparse
 import requests
 
 from ..infrastructure.api.case_client import AudioContentType, OyezCaseClient
+from ..infrastructure.concurrency import submit_bounded
 from ..infrastructure.exceptions.api_exceptions import (
     OyezApiError,
 )
@@ -22,6 +27,47 @@ from ..infrastructure.storage.cache import RawDataCache
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Size of the chunks audio downloads are read in and written to the cache
+AUDIO_CHUNK_SIZE = 256 * 1024
+
+
+def _parse_term_year(term: str) -> int | None:
+    """Parse the starting year of a term.
+
+    Args:
+        term: The term identifier (e.g., "2019")
+
+    Returns
+    -------
+        The term year, or None for non-numeric terms
+    """
+    return int(term) if term.isdigit() else None
+
+
+def deduplicate_cases(cases: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Drop repeated entries for the same case, keeping the first occurrence.
+
+    Entries without a term or docket number are kept as-is so that they are
+    still reported as invalid when processed.
+
+    Args:
+        cases: Case data from a case list
+
+    Returns
+    -------
+        The cases with duplicates removed, in their original order
+    """
+    unique: dict[str, dict[str, Any]] = {}
+    invalid: list[dict[str, Any]] = []
+    for case in cases:
+        term = case.get("term")
+        docket = case.get("docket_number")
+        if term and docket:
+            unique.setdefault(f"{term}/{docket}", case)
+        else:
+            invalid.append(case)
+    return [*unique.values(), *invalid]
+
 
 class RawDataScraperService:
     """Service for scraping and caching raw data from the Oyez API.
@@ -34,23 +80,39 @@ class RawDataScraperService:
         self,
         cache_dir: str | Path = ".output",
         api_client: OyezCaseClient | None = None,
+        current_term_ttl: float | None = 24 * 60 * 60,
     ) -> None:
         """Initialize the raw data scraper service.
 
         Args:
             cache_dir: Directory where cache files will be stored
             api_client: Optional API client (creates a new one if not provided)
+            current_term_ttl: Seconds before cached cases from ongoing terms are
+                re-fetched (None to never expire them). Cases from past terms
+                are immutable and always served from the cache.
         """
         self.cache = RawDataCache(cache_dir)
         self.api_client = api_client or OyezCaseClient()
-
-        # Request session for downloading audio files
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-        )
+        self.current_term_ttl = current_term_ttl
+
+        # The two most recent terms may still gain arguments and opinions
+        self.first_ongoing_term = datetime.datetime.now().year - 1
+
+        # Lock guarding statistics shared between scraping threads
+        self.stats_lock = threading.Lock()
+
+        # Request session for downloading audio files. Reuse the API client's
+        # session when available so downloads share its pooled connections.
+        api_session = getattr(self.api_client, "session", None)
+        if isinstance(api_session, requests.Session):
+            self.session = api_session
+        else:
+            self.session = requests.Session()
+            self.session.headers.update(
+                {
+                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+                }
+            )
 
     def scrape_term(
         self, term: str, force_refresh: bool = False
@@ -148,8 +210,8 @@ class RawDataScraperService:
         """
         case_id = f"{term}/{docket}"
 
-        # Check if we already have this case cached
-        if not force_refresh and self.cache.case_exists(case_id):
+        # Check if we already have a fresh copy of this case cached
+        if not force_refresh and self._is_case_fresh(case_id, term):
             logger.debug(f"Using cached case data for {case_id}")
             return self.cache.get_case_data(case_id)
 
@@ -166,6 +228,59 @@ class RawDataScraperService:
             logger.error(f"Failed to fetch case {case_id}: {e}")
             raise
 
+    def scrape_case_from_summary(
+        self, case: dict[str, Any], force_refresh: bool = False
+    ) -> dict[str, Any]:
+        """Scrape a case starting from its case list entry.
+
+        The detail endpoint is only queried when the summary lacks one of the
+        audio fields. Summaries that already carry both ``oral_argument_audio``
+        and ``opinion_announcement`` are returned as-is, saving a round-trip per
+        case. They are not cached as case data, since they lack the rest of the
+        detailed record that scrape_case and get_case_data callers expect.
+
+        Args:
+            case: Case data from a case list
+            force_refresh: If True, re-scrape even if already cached
+
+        Returns
+        -------
+            Case data dictionary
+
+        Raises
+        ------
+            OyezApiError: If there's an error fetching data from the API
+        """
+        term = case["term"]
+        docket = case["docket_number"]
+        case_id = f"{term}/{docket}"
+
+        need_detail = (
+            "oral_argument_audio" not in case or "opinion_announcement" not in case
+        )
+        if need_detail or (not force_refresh and self._is_case_fresh(case_id, term)):
+            return self.scrape_case(term, docket, force_refresh=force_refresh)
+
+        logger.debug(f"Using case list entry for the audio of {case_id}")
+        return case
+
+    def _is_case_fresh(self, case_id: str, term: str) -> bool:
+        """Check if a cached case can be used without re-fetching it.
+
+        Args:
+            case_id: The ID of the case
+            term: The term of the case
+
+        Returns
+        -------
+            True if the cached case is fresh, False otherwise
+        """
+        max_age = None
+        term_year = _parse_term_year(str(term))
+        if term_year is not None and term_year >= self.first_ongoing_term:
+            max_age = self.current_term_ttl
+        return self.cache.is_case_fresh(case_id, max_age)
+
     def scrape_case_audio_content(
         self,
         case_data: dict[str, Any],
@@ -294,15 +409,24 @@ class RawDataScraperService:
             # Download the audio file
             logger.info(f"Downloading audio from {audio_url}")
             try:
-                response = self.session.get(audio_url, stream=True, timeout=30)
-                response.raise_for_status()
-
-                audio_data = response.content
-
-                # Store the audio data in the cache
-                self.cache.store_audio_data(
-                    content_id, audio_data, case_id=case_id, media_type=media_type
-                )
+                # Closing the response returns its connection to the pool even
+                # when the download fails part way through. The shared session
+                # asks for JSON by default, so accept any type for the audio.
+                with self.session.get(
+                    audio_url,
+                    headers={"Accept": "*/*"},
+                    stream=True,
+                    timeout=30,
+                ) as response:
+                    response.raise_for_status()
+
+                    # Stream the audio data into the cache instead of buffering it
+                    self.cache.store_audio_stream(
+                        content_id,
+                        response.iter_content(chunk_size=AUDIO_CHUNK_SIZE),
+                        case_id=case_id,
+                        media_type=media_type,
+                    )
 
                 return content_id
             except requests.RequestException as e:
@@ -407,7 +531,9 @@ class RawDataScraperService:
             list_name, [content_data]
         )  # Store as a list with one item
 
-    def scrape_and_download_all(self, terms: list[str] | None = None) -> dict[str, Any]:
+    def scrape_and_download_all(
+        self, terms: list[str] | None = None, max_workers: int = 4
+    ) -> dict[str, Any]:
         """Scrape and download all available data from the Oyez API.
 
         This is a high-level method that fetches case lists, case details,
@@ -416,6 +542,7 @@ class RawDataScraperService:
         Args:
             terms: Optional list of terms to scrape (e.g., ["2019", "2020"])
                   If None, scrapes all available cases.
+            max_workers: Maximum number of cases scraped concurrently
 
         Returns
         -------
@@ -434,18 +561,22 @@ class RawDataScraperService:
 
         try:
             if terms:
-                # Scrape specific terms
-                for term in terms:
-                    try:
-                        # Get case list for the term
-                        case_list = self.scrape_term(term)
-
-                        # Scrape each case
-                        for case in case_list:
-                            self._scrape_case_from_list(case, stats)
-                    except Exception as e:
-                        logger.error(f"Error scraping term {term}: {e}")
-                        stats["errors"] += 1
+                # Get the case lists of all terms concurrently, then scrape their
+                # cases on a single pool so workers never wait for one term to finish
+                case_list = []
+                with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                    futures = {
+                        term: executor.submit(self.scrape_term, term) for term in terms
+                    }
+                    for term, future in futures.items():
+                        try:
+                            case_list.extend(future.result())
+                        except Exception as e:
+                            logger.error(f"Error scraping term {term}: {e}")
+                            stats["errors"] += 1
+
+                # Scrape each case
+                self._scrape_cases_from_list(case_list, stats, max_workers)
             else:
                 # Scrape all cases
                 try:
@@ -453,8 +584,7 @@ class RawDataScraperService:
                     case_list = self.scrape_all_cases()
 
                     # Scrape each case
-                    for case in case_list:
-                        self._scrape_case_from_list(case, stats)
+                    self._scrape_cases_from_list(case_list, stats, max_workers)
                 except Exception as e:
                     logger.error(f"Error scraping all cases: {e}")
                     stats["errors"] += 1
@@ -465,6 +595,32 @@ class RawDataScraperService:
 
         return stats
 
+    def _scrape_cases_from_list(
+        self, case_list: list[dict[str, Any]], stats: dict[str, Any], max_workers: int
+    ) -> None:
+        """Scrape the cases of a case list concurrently.
+
+        Args:
+            case_list: Case data from a case list
+            stats: Statistics dictionary to update
+            max_workers: Maximum number of cases scraped concurrently
+        """
+        # Case lists can repeat entries across pages; keep one per term/docket
+        unique_cases = deduplicate_cases(case_list)
+
+        with (
+            self.cache.batch(),
+            ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor,
+        ):
+            # Errors are recorded in stats by _scrape_case_from_list itself
+            for future in submit_bounded(
+                executor,
+                functools.partial(self._scrape_case_from_list, stats=stats),
+                unique_cases,
+                2 * max(1, max_workers),
+            ):
+                future.result()
+
     def _scrape_case_from_list(
         self, case: dict[str, Any], stats: dict[str, Any]
     ) -> None:
@@ -487,21 +643,22 @@ class RawDataScraperService:
                 logger.warning(f"Missing term or docket in case: {case}")
                 return
 
-            # Scrape the full case data
-            case_data = self.scrape_case(term, docket)
-            stats["cases_scraped"] += 1
+            # Scrape the full case data, reusing the list entry when complete
+            case_data = self.scrape_case_from_summary(case)
+            with self.stats_lock:
+                stats["cases_scraped"] += 1
 
             # Scrape audio content
             audio_content = self.scrape_case_audio_content(case_data)
 
             # Count audio files
-            audio_count = 0
-            for content_list in audio_content.values():
-                audio_count += len(content_list)
+            audio_count = sum(map(len, audio_content.values()))
 
-            stats["audio_files_downloaded"] += audio_count
+            with self.stats_lock:
+                stats["audio_files_downloaded"] += audio_count
 
             logger.info(f"Scraped case {term}/{docket} with {audio_count} audio files")
         except Exception as e:
             logger.error(f"Error scraping case: {e}")
-            stats["errors"] += 1
+            with self.stats_lock:
+                stats["errors"] += 1
@@ -38,13 +38,15 @@ class TestCliIntegration:
     def test_handle_dry_run_with_terms(self) -> None:
         """Test handling dry run with specific terms."""
         mock_scraper = mock.MagicMock(spec=RawDataScraperService)
-        mock_scraper.scrape_term.side_effect = [
-            [{"term": "2020", "docket_number": "123-45"}],
-            [
+        case_lists = {
+            "2020": [{"term": "2020", "docket_number": "123-45"}],
+            "2019": [
                 {"term": "2019", "docket_number": "234-56"},
                 {"term": "2019", "docket_number": "345-67"},
             ],
-        ]
+        }
+        # Terms are fetched concurrently, so respond by term rather than call order
+        mock_scraper.scrape_term.side_effect = case_lists.__getitem__
 
         terms = ["2020", "2019"]
 
@@ -182,7 +184,9 @@ class TestCliIntegration:
             main()
 
             # Verify handle_dry_run was called with expected args
-            mock_handle_dry_run.assert_called_once_with(mock_scraper, ["2020"])
+            mock_handle_dry_run.assert_called_once_with(
+                mock_scraper, ["2020"], max_workers=4
+            )
 
     def test_main_with_recent_terms(self, temp_dir: Path) -> None:
         """Test main function with recent terms option."""
@@ -166,7 +166,8 @@ class TestRawDataScraperService:
             # Setup mock response for audio download
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.content = b"mock audio data"
+            mock_response.iter_content.return_value = [b"mock audio", b" data"]
+            mock_response.__enter__.return_value = mock_response
             mock_get.return_value = mock_response
 
             # Scrape audio content
@@ -196,7 +197,8 @@ class TestRawDataScraperService:
             # We shouldn't reach this but set it up anyway
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.content = b"mock audio data"
+            mock_response.iter_content.return_value = [b"mock audio", b" data"]
+            mock_response.__enter__.return_value = mock_response
             mock_get.return_value = mock_response
 
             # Scrape audio content again
@@ -219,7 +221,8 @@ class TestRawDataScraperService:
             # Setup mock response for audio download
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.content = b"mock audio data"
+            mock_response.iter_content.return_value = [b"mock audio", b" data"]
+            mock_response.__enter__.return_value = mock_response
             mock_get.return_value = mock_response
 
             # Scrape all data for a specific term
@@ -8,6 +8,7 @@ import pytest
 from oyez_scraping.infrastructure.api.case_client import OyezCaseClient
 from oyez_scraping.infrastructure.exceptions.api_exceptions import (
     OyezApiResponseError,
+    OyezResourceNotFoundError,
 )
 
 
@@ -224,3 +225,87 @@ class TestOyezCaseClientPagination(unittest.TestCase):
             self.assertEqual(
                 mock_iter.call_args[1]["per_page"], self.client.MAX_PAGE_SIZE
             )
+
+
+class TestOyezCaseClientUtterances(unittest.TestCase):
+    """Test utterance extraction in the OyezCaseClient class."""
+
+    def setUp(self) -> None:
+        """Set up the test environment."""
+        self.client = OyezCaseClient()
+
+    def test_extract_utterances_from_segments_and_text_blocks(self) -> None:
+        """Test extracting utterances from segment and text block turns."""
+        audio_content_data = {
+            "transcript": {
+                "sections": [
+                    {
+                        "turns": [
+                            {
+                                "speaker": {"identifier": "j1"},
+                                "segments": [
+                                    {"start": 0.0, "stop": 1.5, "text": "Hello"},
+                                    {"start": 1.5, "stop": 2.0, "text": ""},
+                                ],
+                            },
+                            {
+                                "speaker": {"name": "Counsel"},
+                                "start": 2.0,
+                                "stop": 4.0,
+                                "text_blocks": [
+                                    {"text": "May it"},
+                                    {"text": ""},
+                                    "ignored",
+                                    {"text": "please the Court"},
+                                ],
+                            },
+                            {
+                                "speaker": {},
+                                "segments": [{"start": 4.0, "stop": 5.0, "text": "x"}],
+                            },
+                        ]
+                    }
+                ]
+            }
+        }
+
+        utterances = self.client.extract_utterances(audio_content_data)
+
+        assert utterances == [
+            {"speaker_id": "j1", "start_time": 0.0, "end_time": 1.5, "text": "Hello"},
+            {
+                "speaker_id": "Counsel",
+                "start_time": 2.0,
+                "end_time": 4.0,
+                "text": "May it please the Court",
+            },
+        ]
+
+    def test_extract_audio_url_prefers_mp3(self) -> None:
+        """Test that an MP3 URL is chosen over earlier audio formats."""
+        audio_content_data = {
+            "media_file": [
+                {"mime": "application/x-mpegURL", "href": "http://x/a.m3u8"},
+                {"mime": "audio/ogg", "href": "http://x/a.ogg"},
+                {"mime": "audio/mpeg", "href": "http://x/a.mp3"},
+            ]
+        }
+
+        assert self.client.extract_audio_url(audio_content_data) == "http://x/a.mp3"
+
+    def test_extract_audio_url_falls_back_to_other_audio(self) -> None:
+        """Test that the first other audio URL is used when there is no MP3."""
+        audio_content_data = {
+            "media_file": [
+                {"mime": "text/plain", "href": "http://x/a.txt"},
+                {"mime": "audio/ogg", "href": "http://x/a.ogg"},
+                {"mime": "application/x-mpegURL", "href": "http://x/a.m3u8"},
+            ]
+        }
+
+        assert self.client.extract_audio_url(audio_content_data) == "http://x/a.ogg"
+
+        with pytest.raises(OyezResourceNotFoundError):
+            self.client.extract_audio_url(
+                {"media_file": {"mime": "text/plain", "href": "http://x/a.txt"}}
+            )
@@ -0,0 +1,42 @@
+"""Unit tests for the CircuitBreaker class."""
+
+from unittest import mock
+
+from oyez_scraping.infrastructure.api.circuit_breaker import CircuitBreaker
+
+
+def test_circuit_opens_after_consecutive_failures() -> None:
+    """Test that the circuit only opens after enough consecutive failures."""
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30.0)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert not breaker.allow_request()
+
+
+def test_circuit_probes_after_cooldown() -> None:
+    """Test that an open circuit lets requests through after the cooldown."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0)
+
+    with mock.patch("time.monotonic", return_value=100.0):
+        breaker.record_failure()
+    with mock.patch("time.monotonic", return_value=129.0):
+        assert not breaker.allow_request()
+    with mock.patch("time.monotonic", return_value=130.0):
+        assert breaker.allow_request()
+        # A failed probe starts another cooldown
+        breaker.record_failure()
+        assert not breaker.allow_request()
+    with mock.patch("time.monotonic", return_value=160.0):
+        assert breaker.allow_request()
+
+    # A successful probe closes the circuit
+    breaker.record_success()
+    assert breaker.opened_at is None
+    assert breaker.allow_request()
@@ -0,0 +1,167 @@
+"""Unit tests for the base Oyez API client."""
+
+from unittest import mock
+
+import pytest
+import requests
+
+from oyez_scraping.infrastructure.api.circuit_breaker import CircuitBreaker
+from oyez_scraping.infrastructure.api.client import (
+    POOL_MAXSIZE,
+    OyezClient,
+    _honor_retry_after,
+)
+from oyez_scraping.infrastructure.exceptions.api_exceptions import (
+    CircuitOpenError,
+    OyezApiConnectionError,
+    OyezApiError,
+    RateLimitError,
+)
+
+# The undecorated request logic, bypassing rate limiting and retries
+_raw_get = OyezClient._get.__wrapped__.__wrapped__  # type: ignore[attr-defined]
+
+
+def _make_response(status_code: int, headers: dict[str, str]) -> mock.MagicMock:
+    """Create a mock response with the given status code and headers."""
+    response = mock.MagicMock(spec=requests.Response)
+    response.status_code = status_code
+    response.headers = headers
+    return response
+
+
+@pytest.mark.parametrize("status_code", [429, 503])
+def test_get_raises_rate_limit_error_on_throttle(status_code: int) -> None:
+    """Test that throttling responses raise RateLimitError with Retry-After."""
+    session = mock.MagicMock()
+    session.headers = {}
+    session.get.return_value = _make_response(status_code, {"Retry-After": "7"})
+    client = OyezClient(session=session)
+
+    with pytest.raises(RateLimitError) as exc_info:
+        _raw_get(client, "cases")
+
+    assert exc_info.value.retry_after == 7
+    assert exc_info.value.status_code == status_code
+
+
+def test_parse_retry_after_invalid_value() -> None:
+    """Test that non-numeric Retry-After headers are ignored."""
+    response = _make_response(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+    assert OyezClient._parse_retry_after(response) is None
+
+
+def test_honor_retry_after_extends_wait() -> None:
+    """Test that backoff waits at least as long as Retry-After requests."""
+    details = {"exception": RateLimitError("throttled", retry_after=5), "wait": 2.0}
+
+    with mock.patch("time.sleep") as mock_sleep:
+        _honor_retry_after(details)
+
+    mock_sleep.assert_called_once_with(3.0)
+
+
+def test_honor_retry_after_without_header() -> None:
+    """Test that the backoff wait is unchanged without Retry-After."""
+    details = {"exception": RateLimitError("throttled"), "wait": 2.0}
+
+    with mock.patch("time.sleep") as mock_sleep:
+        _honor_retry_after(details)
+
+    mock_sleep.assert_not_called()
+
+
+def test_default_session_pools_connections() -> None:
+    """Test that a client-created session keeps a pool sized for threads."""
+    client = OyezClient()
+
+    adapter = client.session.get_adapter("https://api.oyez.org/cases")
+    assert adapter._pool_maxsize == POOL_MAXSIZE
+
+
+def test_default_session_pool_size_is_configurable() -> None:
+    """Test that the client-created session's pool can be sized for more threads."""
+    client = OyezClient(pool_maxsize=64)
+
+    adapter = client.session.get_adapter("https://api.oyez.org/cases")
+    assert adapter._pool_maxsize == 64
+
+
+def test_provided_session_is_used_as_is() -> None:
+    """Test that a caller-provided session is not reconfigured."""
+    session = requests.Session()
+    adapter = session.get_adapter("https://api.oyez.org/cases")
+
+    client = OyezClient(session=session)
+
+    assert client.session is session
+    assert client.session.get_adapter("https://api.oyez.org/cases") is adapter
+
+
+def test_get_fails_fast_when_circuit_open() -> None:
+    """Test that repeated failures open the circuit and later requests are skipped."""
+    client = OyezClient(session=mock.MagicMock(headers={}))
+    client.circuit_breaker = CircuitBreaker(failure_threshold=2)
+
+    with mock.patch.object(
+        client, "_get", side_effect=OyezApiConnectionError("down")
+    ) as mock_get:
+        for _ in range(2):
+            with pytest.raises(OyezApiConnectionError):
+                client.get("cases")
+        with pytest.raises(CircuitOpenError):
+            client.get("cases")
+
+    assert mock_get.call_count == 2
+
+
+def test_get_counts_server_errors_only() -> None:
+    """Test that 5xx responses count as failures but client errors do not."""
+    client = OyezClient(session=mock.MagicMock(headers={}))
+
+    def api_error(status_code: int) -> OyezApiError:
+        http_error = requests.exceptions.HTTPError(
+            response=_make_response(status_code, {})
+        )
+        try:
+            raise OyezApiError("error") from http_error
+        except OyezApiError as e:
+            return e
+
+    for status_code, failures in ((500, 1), (502, 2), (400, 0)):
+        with (
+            mock.patch.object(client, "_get", side_effect=api_error(status_code)),
+            pytest.raises(OyezApiError),
+        ):
+            client.get("cases")
+        assert client.circuit_breaker.consecutive_failures == failures
+
+
+def test_get_counts_throttling_server_errors() -> None:
+    """Test that 503 responses count as failures but 429 responses do not."""
+    client = OyezClient(session=mock.MagicMock(headers={}))
+    client.circuit_breaker = CircuitBreaker(failure_threshold=3)
+
+    def throttle(status_code: int) -> None:
+        with (
+            mock.patch.object(
+                client,
+                "_get",
+                side_effect=RateLimitError("throttled", status_code=status_code),
+            ),
+            pytest.raises(RateLimitError),
+        ):
+            client.get("cases")
+
+    throttle(503)
+    throttle(503)
+    assert client.circuit_breaker.consecutive_failures == 2
+    throttle(429)
+    assert client.circuit_breaker.consecutive_failures == 0
+
+    # A server that keeps answering 503 opens the circuit
+    for _ in range(3):
+        throttle(503)
+    with pytest.raises(CircuitOpenError):
+        client.get("cases")
@@ -1,11 +1,15 @@
 """Unit tests for the PaginationMixin."""
 
 from typing import Any
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 
 from oyez_scraping.infrastructure.api.pagination_mixin import PaginationMixin
+from oyez_scraping.infrastructure.exceptions.api_exceptions import (
+    CircuitOpenError,
+    OyezApiConnectionError,
+)
 
 
 class MockClient(PaginationMixin):
@@ -231,3 +235,45 @@ def test_get_paginated_resource_non_list_response(client: MockClient) -> None:
     # Assert
     client.get.assert_called_once_with(endpoint, params={"page": "0"})
     assert results == []
+
+
+def test_get_page_resource_retries_connection_errors(client: MockClient) -> None:
+    """Test that transient connection errors are retried."""
+    # Arrange
+    client.get.side_effect = [
+        OyezApiConnectionError("Connection reset"),
+        [{"id": 1}],
+    ]
+
+    # Act
+    with patch("time.sleep") as mock_sleep:
+        result = client.get_page_resource("test/endpoint", page=3)
+
+    # Assert
+    assert result == [{"id": 1}]
+    assert client.get.call_count == 2
+    mock_sleep.assert_called_once()
+
+
+def test_get_page_resource_gives_up_after_retries(client: MockClient) -> None:
+    """Test that persistent connection errors are eventually raised."""
+    # Arrange
+    client.get.side_effect = OyezApiConnectionError("Connection refused")
+    client.page_retry_attempts = 2
+
+    # Act / Assert
+    with patch("time.sleep"), pytest.raises(OyezApiConnectionError):
+        client.get_page_resource("test/endpoint", page=0)
+    assert client.get.call_count == 3
+
+
+def test_get_page_resource_does_not_retry_open_circuit(client: MockClient) -> None:
+    """Test that an open circuit fails fast instead of being retried."""
+    # Arrange
+    client.get.side_effect = CircuitOpenError("Oyez API is failing repeatedly")
+
+    # Act / Assert
+    with patch("time.sleep") as mock_sleep, pytest.raises(CircuitOpenError):
+        client.get_page_resource("test/endpoint", page=0)
+    assert client.get.call_count == 1
+    mock_sleep.assert_not_called()
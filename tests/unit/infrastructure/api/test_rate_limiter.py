@@ -0,0 +1,25 @@
+"""Unit tests for the AdaptiveRateLimiter class."""
+
+from unittest import mock
+
+from oyez_scraping.infrastructure.api.rate_limiter import AdaptiveRateLimiter
+
+
+def test_error_retries_use_full_jitter() -> None:
+    """Test that non-rate-limit retries wait a random time up to a capped backoff."""
+    limiter = AdaptiveRateLimiter(min_delay=1.0, max_delay=2.0, max_retries=3)
+    func = mock.Mock(side_effect=[ValueError("boom")] * 3 + ["ok"])
+
+    with (
+        mock.patch("time.sleep") as mock_sleep,
+        mock.patch("random.uniform", side_effect=lambda _, b: b) as mock_uniform,
+    ):
+        assert limiter.execute_with_rate_limit(func, "endpoint") == "ok"
+
+    # The backoff grows by 1.5x per retry but never exceeds max_delay
+    assert [c.args for c in mock_uniform.call_args_list] == [
+        (0, 1.0),
+        (0, 1.5),
+        (0, 2.0),
+    ]
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 1.5, 2.0]
@@ -2,6 +2,7 @@
 
 import os
 import tempfile
+import time
 from pathlib import Path
 from unittest import mock
 
@@ -59,6 +60,42 @@ class TestRawDataCache:
             case_file = os.path.join(temp_dir, "cases", "2019-17-1618.json")
             assert os.path.isfile(case_file)
 
+    def test_is_case_fresh(self) -> None:
+        """Test checking case freshness against a maximum age."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = RawDataCache(temp_dir)
+
+            assert not cache.is_case_fresh("2019/17-1618")
+
+            cache.store_case_data("2019/17-1618", {"id": "2019/17-1618"})
+            cached_at = cache.cache_index["cases"]["2019/17-1618"]["cached_at"]
+
+            assert cache.is_case_fresh("2019/17-1618")
+            with mock.patch("time.time", return_value=cached_at + 100):
+                assert cache.is_case_fresh("2019/17-1618", max_age=200)
+                assert not cache.is_case_fresh("2019/17-1618", max_age=50)
+                assert cache.is_case_fresh("2019/17-1618", max_age=None)
+
+    def test_batch_defers_index_writes(self) -> None:
+        """Test that the index is saved once when the outermost batch exits."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = RawDataCache(temp_dir)
+            cache._index_saved_at = time.time()
+
+            with mock.patch.object(cache.storage, "write_json") as mock_write:
+                with cache.batch():
+                    with cache.batch():
+                        cache.store_case_list("list1", [{"id": "case1"}])
+                    cache.store_case_list("list2", [{"id": "case2"}])
+                    # Only the case list files were written so far
+                    assert mock_write.call_count == 2
+
+                assert mock_write.call_count == 3
+                assert mock_write.call_args[0][0] == cache.index_path
+
+            assert cache.case_list_exists("list1")
+            assert cache.case_list_exists("list2")
+
     def test_get_nonexistent_case(self) -> None:
         """Test retrieving a non-existent case."""
         with tempfile.TemporaryDirectory() as temp_dir:
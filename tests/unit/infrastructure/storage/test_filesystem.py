@@ -3,6 +3,7 @@
 import json
 import os
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 from unittest import mock
 
@@ -195,6 +196,29 @@ class TestFilesystemStorage:
 
         assert "Failed to list files" in str(excinfo.value)
 
+    def test_get_directory_size(self) -> None:
+        """Test get_directory_size sums files in nested directories."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            subdir = os.path.join(temp_dir, "subdir", "nested")
+            os.makedirs(subdir)
+
+            with open(os.path.join(temp_dir, "a.bin"), "wb") as f:
+                f.write(b"x" * 10)
+            with open(os.path.join(subdir, "b.bin"), "wb") as f:
+                f.write(b"x" * 32)
+
+            storage = FilesystemStorage()
+            assert storage.get_directory_size(temp_dir) == 42
+            assert storage.get_directory_size(Path(temp_dir) / "subdir") == 32
+
+    def test_get_directory_size_nonexistent_dir(self) -> None:
+        """Test get_directory_size with a non-existent directory."""
+        storage = FilesystemStorage()
+        with pytest.raises(FileReadError) as excinfo:
+            storage.get_directory_size("/nonexistent/directory")
+
+        assert "Failed to calculate directory size" in str(excinfo.value)
+
     def test_read_write_bytes(self) -> None:
         """Test read_bytes and write_bytes methods."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -233,6 +257,33 @@ class TestFilesystemStorage:
             assert os.path.isdir(os.path.join(temp_dir, "nested"))
             assert os.path.isdir(os.path.join(temp_dir, "nested", "dir"))
 
+    def test_write_stream(self) -> None:
+        """Test that write_stream writes all chunks and returns their size."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage = FilesystemStorage()
+            file_path = Path(temp_dir) / "subdir" / "stream.bin"
+
+            size = storage.write_stream(file_path, iter([b"abc", b"", b"defg"]))
+
+            assert size == 7
+            assert file_path.read_bytes() == b"abcdefg"
+            assert os.listdir(file_path.parent) == ["stream.bin"]
+
+    def test_write_stream_interrupted(self) -> None:
+        """Test that an interrupted stream leaves no file and keeps its error."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage = FilesystemStorage()
+            file_path = Path(temp_dir) / "stream.bin"
+
+            def chunks() -> Iterator[bytes]:
+                yield b"partial"
+                raise ConnectionError("Connection reset")
+
+            with pytest.raises(ConnectionError):
+                storage.write_stream(file_path, chunks())
+
+            assert os.listdir(temp_dir) == []
+
     def test_read_bytes_nonexistent_file(self) -> None:
         """Test read_bytes with a non-existent file."""
         storage = FilesystemStorage()
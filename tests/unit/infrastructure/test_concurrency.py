@@ -0,0 +1,51 @@
+"""Unit tests for the concurrency helpers."""
+
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from oyez_scraping.infrastructure.concurrency import submit_bounded
+
+
+def test_submit_bounded_runs_every_item() -> None:
+    """Test that every item is processed exactly once."""
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = [
+            future.result()
+            for future in submit_bounded(executor, lambda x: x * 2, range(20), 4)
+        ]
+
+    assert sorted(results) == [x * 2 for x in range(20)]
+
+
+def test_submit_bounded_limits_pending_tasks() -> None:
+    """Test that items are pulled lazily and at most max_pending run at once."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+    pulled = 0
+
+    def task(_: int) -> None:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        with lock:
+            in_flight -= 1
+
+    def items() -> Iterator[int]:
+        nonlocal pulled
+        for i in range(50):
+            pulled += 1
+            yield i
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = submit_bounded(executor, task, items(), 2)
+        next(futures)
+        # Only the initial tasks and their replacements have been pulled
+        assert pulled <= 4
+        for _ in futures:
+            pass
+
+    assert pulled == 50
+    assert peak <= 2
@@ -0,0 +1,44 @@
+"""Unit tests for the JSON codec helpers."""
+
+from unittest import mock
+
+import pytest
+
+from oyez_scraping.infrastructure import json_codec
+
+
+@pytest.mark.parametrize("data", [b'{"a": [1, 2]}', '{"a": [1, 2]}'])
+def test_loads(data: bytes | str) -> None:
+    """Test decoding JSON from bytes and text."""
+    assert json_codec.loads(data) == {"a": [1, 2]}
+
+
+def test_loads_without_orjson() -> None:
+    """Test that decoding falls back to the standard library."""
+    with mock.patch.object(json_codec, "orjson", None):
+        assert json_codec.loads(b'[{"id": 1}]') == [{"id": 1}]
+
+
+def test_loads_invalid_json() -> None:
+    """Test that invalid JSON raises ValueError."""
+    with pytest.raises(ValueError):
+        json_codec.loads(b"{not json")
+
+
+@pytest.mark.parametrize("indent", [None, 2, 4])
+def test_dumps_round_trip(indent: int | None) -> None:
+    """Test that encoded data decodes back to the original object."""
+    data = {"name": "Roe v. Wade", "terms": [1971, 1972], "justice": "Blackmun ✓"}
+
+    encoded = json_codec.dumps(data, indent=indent)
+
+    assert isinstance(encoded, bytes)
+    assert json_codec.loads(encoded) == data
+
+
+def test_dumps_without_orjson() -> None:
+    """Test that encoding falls back to the standard library."""
+    with mock.patch.object(json_codec, "orjson", None):
+        encoded = json_codec.dumps({"key": "✓"}, indent=2)
+
+    assert encoded == '{\n  "key": "✓"\n}'.encode()
@@ -2,6 +2,7 @@
 
 import tempfile
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 from unittest import mock
@@ -103,39 +104,57 @@ class TestDownloadService:
 
     def test_get_current_stats(self, download_service: DownloadService) -> None:
         """Test getting current statistics."""
-        # Mock the cache_dir glob to return a list of mock files
-        with mock.patch("pathlib.Path.glob") as mock_glob:
-            mock_files = [
-                mock.MagicMock(stat=lambda: mock.MagicMock(st_size=1024 * 1024))
-                for _ in range(3)
-            ]
-            mock_glob.return_value = mock_files
-
-            # Get stats
-            stats = download_service._get_current_stats()
-
-            # Verify expected stats are present
-            assert stats["item_count"] == 10
-            assert stats["audio_count"] == 5
-            assert stats["case_list_count"] == 2
-            assert stats["cache_size_mb"] == 3.0  # 3 files at 1MB each
-            assert stats["items_processed"] == 0
-            assert stats["audio_files_downloaded"] == 0
-            assert stats["errors"] == 0
-            assert stats["failed_items"] == 2
-            assert stats["retriable_items"] == 1
-            assert stats["permanent_failures"] == 1
+        # Mock the cache directory size
+        download_service.storage.get_directory_size.return_value = 3 * 1024 * 1024
+
+        # Get stats
+        stats = download_service._get_current_stats()
+
+        # Verify expected stats are present
+        assert stats["item_count"] == 10
+        assert stats["audio_count"] == 5
+        assert stats["case_list_count"] == 2
+        assert stats["cache_size_mb"] == 3.0  # 3 MB in total
+        assert stats["items_processed"] == 0
+        assert stats["audio_files_downloaded"] == 0
+        assert stats["errors"] == 0
+        assert stats["failed_items"] == 2
+        assert stats["retriable_items"] == 1
+        assert stats["permanent_failures"] == 1
 
     def test_get_current_stats_handles_exceptions(
         self, download_service: DownloadService
     ) -> None:
         """Test that _get_current_stats handles exceptions when calculating cache size."""
-        # Mock the glob to raise an exception
-        with mock.patch("pathlib.Path.glob", side_effect=Exception("Test exception")):
-            stats = download_service._get_current_stats()
+        # Mock the size calculation to raise an exception
+        download_service.storage.get_directory_size.side_effect = Exception(
+            "Test exception"
+        )
+        stats = download_service._get_current_stats()
+
+        # Should still return stats with cache_size_mb set to 0
+        assert stats["cache_size_mb"] == 0.0
 
-            # Should still return stats with cache_size_mb set to 0
-            assert stats["cache_size_mb"] == 0.0
+    def test_cache_size_estimated_between_walks(
+        self, download_service: DownloadService
+    ) -> None:
+        """Test that the cache is only walked once per status interval."""
+        get_size = download_service.storage.get_directory_size
+        get_size.return_value = 10 * 1024 * 1024
+
+        with mock.patch("time.time", return_value=1000.0):
+            assert download_service._get_cache_size_mb(audio_count=5) == 10.0
+            # Within the interval the size is extrapolated from new audio files
+            assert download_service._get_cache_size_mb(audio_count=7) == 14.0
+            assert get_size.call_count == 1
+
+            # Exact measurements always walk the cache
+            assert download_service._get_cache_size_mb(7, exact=True) == 10.0
+            assert get_size.call_count == 2
+
+        with mock.patch("time.time", return_value=1002.0):
+            download_service._get_cache_size_mb(audio_count=7)
+            assert get_size.call_count == 3
 
     def test_start_stop_progress_monitoring(
         self, download_service: DownloadService
@@ -248,6 +267,26 @@ class TestDownloadService:
         # Scrape_case should only have been called once
         assert mock_scraper.scrape_case.call_count == 1
 
+    def test_process_case_concurrent_duplicates_scraped_once(
+        self, download_service: DownloadService, mock_scraper: mock.MagicMock
+    ) -> None:
+        """Test that concurrent workers never scrape the same case twice."""
+        case = {"term": "2020", "docket_number": "123-45"}
+        processed_cases: set[str] = set()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda c: download_service._process_case(
+                        c, skip_audio=True, processed_cases=processed_cases
+                    ),
+                    [case] * 32,
+                )
+            )
+
+        assert all(success for success, _ in results)
+        mock_scraper.scrape_case.assert_called_once_with("2020", "123-45")
+
     def test_process_case_with_missing_data(
         self, download_service: DownloadService, mock_scraper: mock.MagicMock
     ) -> None:
@@ -291,6 +330,21 @@ class TestDownloadService:
         # Should have marked the case as failed
         mark_failed_mock.assert_called_once_with("2020/123-45", case)
 
+    def test_process_case_with_tracker_error(
+        self, download_service: DownloadService, mock_scraper: mock.MagicMock
+    ) -> None:
+        """Test that a failing tracker still yields a failed result."""
+        mock_scraper.scrape_case.side_effect = Exception("Test error")
+        download_service.download_tracker.mark_failed.side_effect = Exception(
+            "Tracker error"
+        )
+
+        result = download_service._process_case(
+            {"term": "2020", "docket_number": "123-45"}
+        )
+
+        assert result == (False, 0)
+
     def test_download_term(
         self, download_service: DownloadService, mock_scraper: mock.MagicMock
     ) -> None:
@@ -331,6 +385,56 @@ class TestDownloadService:
             assert download_service.stats["items_processed"] == 2
             assert download_service.stats["audio_files_downloaded"] == 4
 
+    def test_download_term_projects_case_summaries(
+        self, download_service: DownloadService, mock_scraper: mock.MagicMock
+    ) -> None:
+        """Test that only the fields needed for scraping are kept per case."""
+        mock_scraper.scrape_term.return_value = [
+            {
+                "term": "2020",
+                "docket_number": "123-45",
+                "name": "Test Case",
+                "description": "A long description",
+            }
+        ]
+
+        with (
+            mock.patch.object(
+                download_service, "_process_case", return_value=(True, 0)
+            ) as mock_process,
+            mock.patch.object(download_service, "_start_progress_monitoring"),
+            mock.patch.object(download_service, "_stop_progress_monitoring"),
+        ):
+            download_service.download_term("2020")
+
+            mock_process.assert_called_once_with(
+                {"term": "2020", "docket_number": "123-45"},
+                skip_audio=False,
+                processed_cases=None,
+            )
+
+    def test_download_term_deduplicates_cases(
+        self, download_service: DownloadService, mock_scraper: mock.MagicMock
+    ) -> None:
+        """Test that repeated case list entries are only processed once."""
+        mock_scraper.scrape_term.return_value = [
+            {"term": "2020", "docket_number": "123-45"},
+            {"term": "2020", "docket_number": "678-90"},
+            {"term": "2020", "docket_number": "123-45", "name": "Duplicate"},
+        ]
+
+        with (
+            mock.patch.object(
+                download_service, "_process_case", return_value=(True, 0)
+            ) as mock_process,
+            mock.patch.object(download_service, "_start_progress_monitoring"),
+            mock.patch.object(download_service, "_stop_progress_monitoring"),
+        ):
+            result = download_service.download_term("2020")
+
+        assert mock_process.call_count == 2
+        assert result["total_cases"] == 2
+
     def test_download_term_with_exception(
         self, download_service: DownloadService, mock_scraper: mock.MagicMock
     ) -> None:
@@ -355,11 +459,23 @@ class TestDownloadService:
             mock_start_monitor.assert_called_once()
             mock_stop_monitor.assert_called_once()
 
-    def test_download_multiple_terms(self, download_service: DownloadService) -> None:
-        """Test downloading multiple terms."""
-        # Mock download_term method
+    def test_download_multiple_terms(
+        self, download_service: DownloadService, mock_scraper: mock.MagicMock
+    ) -> None:
+        """Test that the cases of all terms are processed on a single pool."""
+        case_lists = {
+            "2019": [{"term": "2019", "docket_number": "123-45"}],
+            "2020": [
+                {"term": "2020", "docket_number": "234-56"},
+                {"term": "2020", "docket_number": "345-67"},
+            ],
+        }
+        mock_scraper.scrape_term.side_effect = case_lists.__getitem__
+
         with (
-            mock.patch.object(download_service, "download_term") as mock_download_term,
+            mock.patch.object(
+                download_service, "_process_case", return_value=(True, 1)
+            ) as mock_process,
             mock.patch.object(download_service, "_retry_failed_cases") as mock_retry,
             mock.patch.object(download_service, "_start_progress_monitoring"),
             mock.patch.object(download_service, "_stop_progress_monitoring"),
@@ -369,10 +485,15 @@ class TestDownloadService:
                 ["2019", "2020"], skip_audio=True
             )
 
-            # Verify each term was downloaded
-            assert mock_download_term.call_count == 2
-            mock_download_term.assert_any_call("2019", skip_audio=True)
-            mock_download_term.assert_any_call("2020", skip_audio=True)
+            # Verify the cases of every term were processed
+            assert mock_scraper.scrape_term.call_count == 2
+            assert mock_process.call_count == 3
+            mock_process.assert_any_call(
+                {"term": "2019", "docket_number": "123-45"},
+                skip_audio=True,
+                processed_cases=None,
+            )
+            assert download_service.stats["items_processed"] == 3
 
             # Verify retry was called
             mock_retry.assert_called_once_with(skip_audio=True)
@@ -382,23 +503,22 @@ class TestDownloadService:
             assert "elapsed_time_formatted" in stats
 
     def test_download_multiple_terms_with_term_error(
-        self, download_service: DownloadService
+        self, download_service: DownloadService, mock_scraper: mock.MagicMock
     ) -> None:
         """Test downloading multiple terms where one term fails."""
-        # Create a mock for download_term
-        mock_download_term = mock.MagicMock()
 
-        # Define the side effect function
-        def mock_download_side_effect(term: str, **_: Any) -> None:
+        def mock_scrape_term(term: str) -> list[dict[str, Any]]:
             """Mock side effect function that raises an error for 2020 term."""
             if term == "2020":
                 raise Exception("Test error")
+            return [{"term": term, "docket_number": "123-45"}]
 
-        # Set the side effect on the mock
-        mock_download_term.side_effect = mock_download_side_effect
+        mock_scraper.scrape_term.side_effect = mock_scrape_term
 
         with (
-            mock.patch.object(download_service, "download_term", mock_download_term),
+            mock.patch.object(
+                download_service, "_process_case", return_value=(True, 0)
+            ) as mock_process,
             mock.patch.object(download_service, "_retry_failed_cases") as mock_retry,
             mock.patch.object(download_service, "_start_progress_monitoring"),
             mock.patch.object(download_service, "_stop_progress_monitoring"),
@@ -406,8 +526,9 @@ class TestDownloadService:
             # Download multiple terms
             download_service.download_multiple_terms(["2019", "2020"], skip_audio=True)
 
-            # Verify each term was attempted
-            assert mock_download_term.call_count == 2
+            # Verify each term was attempted and the other term still processed
+            assert mock_scraper.scrape_term.call_count == 2
+            mock_process.assert_called_once()
 
             # Verify retry was still called
             mock_retry.assert_called_once()
@@ -0,0 +1,192 @@
+"""Unit tests for the raw data scraper service."""
+
+import datetime
+import io
+import tempfile
+import time
+from collections.abc import Generator
+from pathlib import Path
+from unittest import mock
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from oyez_scraping.infrastructure.api.case_client import OyezCaseClient
+from oyez_scraping.services.raw_data_scraper import (
+    RawDataScraperService,
+    deduplicate_cases,
+)
+
+
+class TestRawDataScraperService:
+    """Test cases for the RawDataScraperService class."""
+
+    @pytest.fixture
+    def mock_api_client(self) -> mock.MagicMock:
+        """Fixture providing a mock OyezCaseClient."""
+        client_mock = mock.MagicMock(spec=OyezCaseClient)
+        client_mock.get_case_by_id.return_value = {
+            "term": "2020",
+            "docket_number": "123-45",
+            "name": "Detailed Case",
+            "oral_argument_audio": [],
+            "opinion_announcement": [],
+        }
+        return client_mock
+
+    @pytest.fixture
+    def temp_dir(self) -> Generator[Path, None, None]:
+        """Fixture providing a temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield Path(temp_dir)
+
+    @pytest.fixture
+    def scraper(
+        self, temp_dir: Path, mock_api_client: mock.MagicMock
+    ) -> RawDataScraperService:
+        """Fixture providing a RawDataScraperService with a mock API client."""
+        return RawDataScraperService(cache_dir=temp_dir, api_client=mock_api_client)
+
+    def test_scrape_case_from_summary_with_audio_fields(
+        self, scraper: RawDataScraperService, mock_api_client: mock.MagicMock
+    ) -> None:
+        """Test that a complete summary is used without a detail request."""
+        case = {
+            "term": "2020",
+            "docket_number": "123-45",
+            "name": "Summary Case",
+            "oral_argument_audio": [{"href": "https://example.com/1"}],
+            "opinion_announcement": [],
+        }
+
+        result = scraper.scrape_case_from_summary(case)
+
+        assert result == case
+        mock_api_client.get_case_by_id.assert_not_called()
+
+        # The partial summary is not cached in place of the detailed record
+        assert not scraper.cache.case_exists("2020/123-45")
+        assert scraper.scrape_case("2020", "123-45")["name"] == "Detailed Case"
+        mock_api_client.get_case_by_id.assert_called_once_with("2020", "123-45")
+
+    def test_scrape_case_from_summary_missing_audio_fields(
+        self, scraper: RawDataScraperService, mock_api_client: mock.MagicMock
+    ) -> None:
+        """Test that an incomplete summary falls back to the detail endpoint."""
+        case = {"term": "2020", "docket_number": "123-45", "name": "Summary Case"}
+
+        result = scraper.scrape_case_from_summary(case)
+
+        assert result["name"] == "Detailed Case"
+        mock_api_client.get_case_by_id.assert_called_once_with("2020", "123-45")
+
+    def test_scrape_case_from_summary_prefers_cache(
+        self, scraper: RawDataScraperService, mock_api_client: mock.MagicMock
+    ) -> None:
+        """Test that an already cached case is not overwritten by the summary."""
+        cached = {"term": "2020", "docket_number": "123-45", "name": "Cached Case"}
+        scraper.cache.store_case_data("2020/123-45", cached)
+        case = {
+            "term": "2020",
+            "docket_number": "123-45",
+            "oral_argument_audio": [],
+            "opinion_announcement": [],
+        }
+
+        result = scraper.scrape_case_from_summary(case)
+
+        assert result == cached
+        mock_api_client.get_case_by_id.assert_not_called()
+
+    def test_scrape_case_refreshes_stale_current_term(
+        self, temp_dir: Path, mock_api_client: mock.MagicMock
+    ) -> None:
+        """Test that stale cases from an ongoing term are re-fetched."""
+        scraper = RawDataScraperService(
+            cache_dir=temp_dir, api_client=mock_api_client, current_term_ttl=0
+        )
+        term = str(datetime.datetime.now().year)
+        scraper.cache.store_case_data(f"{term}/123-45", {"name": "Stale Case"})
+
+        with mock.patch("time.time", return_value=time.time() + 10):
+            result = scraper.scrape_case(term, "123-45")
+
+        assert result["name"] == "Detailed Case"
+        mock_api_client.get_case_by_id.assert_called_once_with(term, "123-45")
+
+    def test_scrape_case_keeps_past_term_cached(
+        self, temp_dir: Path, mock_api_client: mock.MagicMock
+    ) -> None:
+        """Test that cases from past terms never expire."""
+        scraper = RawDataScraperService(
+            cache_dir=temp_dir, api_client=mock_api_client, current_term_ttl=0
+        )
+        scraper.cache.store_case_data("1971/70-18", {"name": "Cached Case"})
+
+        with mock.patch("time.time", return_value=time.time() + 10):
+            result = scraper.scrape_case("1971", "70-18")
+
+        assert result["name"] == "Cached Case"
+        mock_api_client.get_case_by_id.assert_not_called()
+
+    def test_reuses_api_client_session(self, temp_dir: Path) -> None:
+        """Test that audio downloads share the API client's session."""
+        api_client = OyezCaseClient()
+
+        scraper = RawDataScraperService(cache_dir=temp_dir, api_client=api_client)
+
+        assert scraper.session is api_client.session
+
+    def test_audio_download_accepts_any_type(self, temp_dir: Path) -> None:
+        """Test that audio downloads don't send the API client's JSON Accept header."""
+        api_client = OyezCaseClient()
+        scraper = RawDataScraperService(cache_dir=temp_dir, api_client=api_client)
+        audio_url = "https://s3.amazonaws.com/oyez.case-media.mp3/case_data/1.mp3"
+
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(b"mock audio data")
+
+        with (
+            mock.patch.object(api_client, "extract_audio_url", return_value=audio_url),
+            mock.patch.object(api_client, "verify_audio_url", return_value=True),
+            mock.patch.object(HTTPAdapter, "send", return_value=response) as mock_send,
+        ):
+            content_id = scraper._download_audio_file({}, "audio-1")
+
+        assert content_id == "audio-1"
+        assert mock_send.call_args.args[0].headers["Accept"] == "*/*"
+        assert api_client.session.headers["Accept"] == "application/json"
+
+    def test_scrape_and_download_all_deduplicates_cases(
+        self, scraper: RawDataScraperService, mock_api_client: mock.MagicMock
+    ) -> None:
+        """Test that repeated case list entries are only scraped once."""
+        case = {"term": "2020", "docket_number": "123-45"}
+        mock_api_client.get_cases_by_term.return_value = [case, dict(case)]
+        mock_api_client.get_case_audio_content.return_value = {}
+
+        stats = scraper.scrape_and_download_all(terms=["2020"])
+
+        assert stats["cases_scraped"] == 1
+        assert stats["errors"] == 0
+        mock_api_client.get_case_by_id.assert_called_once_with("2020", "123-45")
+
+
+def test_deduplicate_cases_keeps_first_and_invalid_entries() -> None:
+    """Test that the first entry per case is kept and invalid entries survive."""
+    cases = [
+        {"term": "2019", "docket_number": "1", "name": "first"},
+        {"docket_number": "2"},
+        {"term": "2019", "docket_number": "1", "name": "second"},
+        {"term": "2019"},
+        {"term": "2020", "docket_number": "1"},
+    ]
+
+    assert deduplicate_cases(cases) == [
+        {"term": "2019", "docket_number": "1", "name": "first"},
+        {"term": "2020", "docket_number": "1"},
+        {"docket_number": "2"},
+        {"term": "2019"},
+    ]